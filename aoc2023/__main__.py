@@ -4,10 +4,12 @@
 
 import logging
 import sys
+from functools import cache
+from itertools import groupby
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
 import click
-from rich.console import Console
-from rich.logging import RichHandler
 
 from aoc2023.data import (
     DAY_COUNT_MAX,
@@ -16,19 +18,33 @@ from aoc2023.data import (
     YEAR,
     day_parts_with_solutions,
     days_with_solutions,
-    get_puzzle_inputs,
-    get_puzzle_solution,
 )
+from aoc2023.runner import list_jobs, run_jobs
+
+# rich and the benchmarking code are only imported once they are needed, so
+# that starting the CLI stays fast
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from aoc2023.bench import BenchStats, ScaleStats
+    from aoc2023.corpus import CorpusOptions, CorpusResult, CorpusSummary
+    from aoc2023.profiling import ProfileReport
+    from aoc2023.runner import Job, Result
 
 CLICK_CONTEXT = {"help_option_names": ["-h", "--help"]}
 
 ANSWER_LEN = "10"
 
+OUTPUT_FORMATS = ("text", "json", "ndjson", "csv")
+
 
 def setup_logging(verbosity: int = 0) -> None:
     """
     Set up a root logger with console output.
 
+    Rich is only used to format logs once verbosity is raised, so that runs
+    with the default verbosity and machine-readable output never import it.
+
     Args:
         verbosity (int, optional): The logging level; 0=Error, 1=Warning,
             2=Info, 3+=Debug. Defaults to 0.
@@ -41,14 +57,34 @@ def setup_logging(verbosity: int = 0) -> None:
     elif verbosity >= 3:  # noqa: PLR2004
         logging_level = logging.DEBUG
 
+    # Logged to stderr so it can't be mixed into machine-readable output
+    handler: logging.Handler
+
+    if verbosity <= 0:
+        handler = logging.StreamHandler(sys.stderr)
+
+    else:
+        from rich.console import Console
+        from rich.logging import RichHandler
+
+        handler = RichHandler(rich_tracebacks=True, console=Console(stderr=True))
+
     logging.basicConfig(
         level=logging_level,
         format="%(message)s",
         datefmt="[%x]",
-        handlers=[RichHandler(rich_tracebacks=True)],
+        handlers=[handler],
     )
 
 
+@cache
+def get_console() -> "Console":
+    """Return the console shared by all output."""
+    from rich.console import Console
+
+    return Console(highlight=False)
+
+
 @click.command(context_settings=CLICK_CONTEXT)
 @click.argument("DAY", required=False, default="")
 @click.argument("PART", required=False, default="")
@@ -61,11 +97,97 @@ def setup_logging(verbosity: int = 0) -> None:
     type=bool,
     help="Processes the example inputs instead of the user input",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of processes to compute solutions in; 0 uses every CPU",
+)
+@click.option(
+    "--bench",
+    "-b",
+    is_flag=True,
+    default=False,
+    help="Time each solution over repeated runs instead of checking answers",
+)
+@click.option(
+    "--bench-json",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Also write the benchmark results to a JSON file",
+)
+@click.option(
+    "--scale",
+    type=click.IntRange(min=1),
+    default=None,
+    metavar="MAX",
+    help="Time each solution over generated inputs of 10, 100, ... up to MAX items",
+)
+@click.option(
+    "--corpus",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Run a single DAY and PART over every input file in this directory",
+)
+@click.option(
+    "--answers",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="JSON file of the expected answers for the --corpus inputs, by filename",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Always compute answers instead of using the on-disk answer cache",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS, case_sensitive=False),
+    default="text",
+    show_default=True,
+    help="Print a report, or one machine-readable record per answer",
+)
+@click.option(
+    "--profile",
+    "-p",
+    is_flag=True,
+    default=False,
+    help="Profile each solution with cProfile and print the hottest functions",
+)
+@click.option(
+    "--trace-memory",
+    "-m",
+    is_flag=True,
+    default=False,
+    help="Trace each solution's allocations and print its peak memory use",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Also save cProfile stats to .prof files in this directory",
+)
 @click.option("-v", "--verbose", count=True)
-def cli(
+def cli(  # noqa: PLR0913
     day: str = "",
     part: str = "",
     test: bool = False,
+    jobs: int = 1,
+    bench: bool = False,
+    bench_json: Optional[Path] = None,
+    scale: Optional[int] = None,
+    corpus: Optional[Path] = None,
+    answers: Optional[Path] = None,
+    no_cache: bool = False,
+    output_format: str = "text",
+    profile: bool = False,
+    trace_memory: bool = False,
+    profile_dir: Optional[Path] = None,
     verbose: int = 0,
 ) -> int:
     """
@@ -89,9 +211,55 @@ def cli(
     selected_days = parse_day_selection(day)
     selected_parts = parse_part_selection(selected_days, part)
 
-    for day_no in selected_days:
-        for part_id in selected_parts:
-            print_day_report(day_no, part_id, test)
+    if corpus is not None:
+        if len(selected_days) != 1 or len(selected_parts) != 1:
+            raise click.ClickException("--corpus needs a single DAY and PART")
+
+        from aoc2023.corpus import CorpusOptions
+
+        run_corpus_report(
+            selected_days[0],
+            selected_parts[0],
+            corpus,
+            CorpusOptions(answers_path=answers, workers=jobs),
+            output_format.lower(),
+        )
+        return 0
+
+    if answers is not None:
+        raise click.ClickException("--answers can only be used with --corpus")
+
+    if scale is not None:
+        run_scaling(selected_days, selected_parts, scale, bench_json)
+        return 0
+
+    if bench or bench_json is not None:
+        run_benchmarks(list_jobs(selected_days, selected_parts, test), bench_json)
+        return 0
+
+    profile_options = None
+    if profile or trace_memory or profile_dir is not None:
+        from aoc2023.profiling import ProfileOptions
+
+        profile_options = ProfileOptions(
+            cpu=profile or profile_dir is not None,
+            memory=trace_memory,
+            dump_dir=profile_dir,
+        )
+
+    results = run_jobs(
+        list_jobs(selected_days, selected_parts, test),
+        jobs,
+        cache=not no_cache,
+        profile=profile_options,
+    )
+
+    if output_format.lower() != "text":
+        write_records(results, output_format.lower())
+        return 0
+
+    for (day_no, part_id), day_results in groupby(results, lambda r: (r.day, r.part)):
+        print_day_report(day_no, part_id, test, list(day_results))
 
     return 0
 
@@ -166,16 +334,17 @@ def parse_part_selection(selected_days: tuple[int, ...], part: str) -> tuple[str
     return parts
 
 
-def print_day_report(day: int, part: str, test: bool) -> None:
+def print_day_report(
+    day: int,
+    part: str,
+    test: bool,
+    results: list["Result"],
+) -> None:
     """Print the test or puzzle solution and result for a day and part."""
-    data = get_puzzle_inputs(day, part, test)
-    solution = get_puzzle_solution(day, part)
-
-    c = Console(highlight=False)
-    rprint = c.print
+    rprint = get_console().print
 
-    for _idx, example in enumerate(data):
-        answer = solution(example.input) or 0
+    for _idx, result in enumerate(results):
+        answer = result.answer
 
         if _idx == 0:
             rprint(
@@ -200,7 +369,7 @@ def print_day_report(day: int, part: str, test: bool) -> None:
             end="",
         )
 
-        expected = example.solution
+        expected = result.expected
         if expected is not None:
             rprint(
                 rf"Expected=[bright_white]{expected:{ANSWER_LEN}d}[/bright_white]",
@@ -215,6 +384,273 @@ def print_day_report(day: int, part: str, test: bool) -> None:
         else:
             print(f"         {'':{ANSWER_LEN}s}   [no answer found]")
 
+        if result.profile is not None:
+            print_profile_report(result.profile)
+
+
+def print_profile_report(report: "ProfileReport") -> None:
+    """Print the profiling results for a single solution."""
+    rprint = get_console().print
+
+    if report.peak_memory is not None:
+        rprint(
+            f"    Peak memory: [bright_white]{report.peak_memory / 1024:,.1f}"
+            "[/bright_white] KiB",
+        )
+
+    if report.dump_path is not None:
+        rprint(f"    Profile saved to [bright_white]{report.dump_path}[/bright_white]")
+
+    if report.hot_functions is not None:
+        rprint(report.hot_functions, markup=False, soft_wrap=True)
+
+
+def write_records(
+    results: Iterable[Union["Result", "CorpusResult"]],
+    output_format: str,
+) -> None:
+    """Write one record per result, as JSON, newline-delimited JSON, or CSV."""
+    import csv
+    import io
+    import json
+
+    records = [r.as_dict() for r in results]
+    buffer = io.StringIO()
+
+    if output_format == "json":
+        json.dump(records, buffer, indent=2)
+        buffer.write("\n")
+
+    elif output_format == "ndjson":
+        for record in records:
+            buffer.write(json.dumps(record))
+            buffer.write("\n")
+
+    elif output_format == "csv" and records:
+        writer = csv.DictWriter(buffer, fieldnames=list(records[0]))
+        writer.writeheader()
+        writer.writerows(records)
+
+    # Written in one go, rather than record by record
+    sys.stdout.write(buffer.getvalue())
+    sys.stdout.flush()
+
+
+def run_benchmarks(jobs: list["Job"], json_path: Optional[Path] = None) -> None:
+    """
+    Time each job and print its statistics.
+
+    Jobs are always timed one at a time, in this process, so that they do not
+    compete with each other for the CPU.
+    """
+    import json
+
+    from aoc2023.bench import bench_job
+
+    results: list[BenchStats] = []
+
+    for job in jobs:
+        stats = bench_job(job)
+        print_bench_report(stats)
+        results.append(stats)
+
+    if json_path is not None:
+        with open(json_path, "w", encoding="utf-8") as out_fh:
+            json.dump([s.as_dict() for s in results], out_fh, indent=2)
+
+
+def print_bench_report(stats: "BenchStats") -> None:
+    """Print the timing statistics for a day and part."""
+    rprint = get_console().print
+
+    rprint(
+        rf"Year [blue]{YEAR}[/blue], "
+        rf"Day [blue]{stats.day:02d}[/blue], "
+        rf"Part [blue]{stats.part.upper()}[/blue]: ",
+        end="",
+    )
+
+    if stats.test:
+        rprint(f"[yellow](Test {stats.seq+1:3d})[/yellow] ", end="")
+    else:
+        rprint("[green](-Puzzle-)[/green] ", end="")
+
+    rprint(rf"Min=[bright_white]{stats.min_ns / 1e6:9.3f}ms[/bright_white], ", end="")
+    rprint(
+        rf"Median=[bright_white]{stats.median_ns / 1e6:9.3f}ms[/bright_white], ",
+        end="",
+    )
+    rprint(rf"P95=[bright_white]{stats.p95_ns / 1e6:9.3f}ms[/bright_white], ", end="")
+    rprint(
+        rf"[bright_white]{stats.throughput / 1e6:8.2f}MB/s[/bright_white] ",
+        end="",
+    )
+    rprint(f"({stats.runs} runs)")
+
+
+def run_scaling(
+    days: Iterable[int],
+    parts: Iterable[str],
+    max_size: int,
+    json_path: Optional[Path] = None,
+) -> None:
+    """Time each solution over generated inputs of growing size."""
+    import json
+
+    from aoc2023.bench import bench_scaling, scale_sizes
+    from aoc2023.data import get_puzzle_generator
+
+    logger = logging.getLogger(__name__)
+    sizes = scale_sizes(max_size)
+    results: list[ScaleStats] = []
+
+    for day in days:
+        if get_puzzle_generator(day) is None:
+            logger.warning("Day %s has no input generator; skipping", day)
+            continue
+
+        for part in parts:
+            for stats in bench_scaling(day, part, sizes):
+                print_scale_report(stats)
+                results.append(stats)
+
+    if json_path is not None:
+        with open(json_path, "w", encoding="utf-8") as out_fh:
+            json.dump([s.as_dict() for s in results], out_fh, indent=2)
+
+
+def print_scale_report(stats: "ScaleStats") -> None:
+    """Print the timing and memory statistics for one input size."""
+    rprint = get_console().print
+
+    rprint(
+        rf"Year [blue]{YEAR}[/blue], "
+        rf"Day [blue]{stats.day:02d}[/blue], "
+        rf"Part [blue]{stats.part.upper()}[/blue]: ",
+        end="",
+    )
+    rprint(rf"Size=[bright_white]{stats.size:9d}[/bright_white], ", end="")
+    rprint(
+        rf"Median=[bright_white]{stats.median_ns / 1e6:9.3f}ms[/bright_white], ",
+        end="",
+    )
+
+    if stats.peak_memory is not None:
+        rprint(
+            rf"Peak=[bright_white]{stats.peak_memory / 1024:10,.1f}KiB"
+            "[/bright_white], ",
+            end="",
+        )
+
+    rprint(
+        rf"[bright_white]{stats.throughput / 1e6:8.2f}MB/s[/bright_white] ",
+        end="",
+    )
+    rprint(f"({stats.runs} runs)")
+
+
+def run_corpus_report(
+    day: int,
+    part: str,
+    corpus_dir: Path,
+    options: Optional["CorpusOptions"] = None,
+    output_format: str = "text",
+) -> None:
+    """Run a day and part over a corpus of inputs, printing each result as it comes."""
+    import time
+
+    from aoc2023.corpus import (
+        CorpusOptions,
+        list_corpus,
+        load_answers,
+        run_corpus,
+        summarize,
+    )
+
+    options = options or CorpusOptions()
+    answers_path = options.answers_path
+
+    # The answers are often kept alongside the inputs
+    paths = list_corpus(corpus_dir, exclude=[answers_path] if answers_path else [])
+    if not paths:
+        raise click.ClickException(f"No inputs found in {corpus_dir}")
+
+    answers = load_answers(answers_path, part) if answers_path is not None else {}
+
+    start = time.perf_counter_ns()
+    results = run_corpus(day, part, paths, answers, options.workers)
+
+    if output_format != "text":
+        write_records(results, output_format)
+        return
+
+    name_len = max(len(p.name) for p in paths)
+    collected: list[CorpusResult] = []
+
+    for result in results:
+        print_corpus_result(result, name_len)
+        collected.append(result)
+
+    print_corpus_summary(summarize(collected, time.perf_counter_ns() - start))
+
+
+def print_corpus_result(result: "CorpusResult", name_len: int) -> None:
+    """Print the answer for one input in a corpus."""
+    rprint = get_console().print
+
+    rprint(rf"[blue]{result.name:{name_len}s}[/blue] ", end="")
+
+    if result.error is not None:
+        rprint(r"[red]\[ERROR][/red] ", end="")
+        rprint(result.error, markup=False)
+        return
+
+    rprint(
+        rf"Solution=[bright_white]{result.answer:{ANSWER_LEN}d}[/bright_white], ",
+        end="",
+    )
+
+    if result.expected is not None:
+        rprint(
+            rf"Expected=[bright_white]{result.expected:{ANSWER_LEN}d}[/bright_white] ",
+            end="",
+        )
+
+        if result.correct:
+            rprint(r"[green]\[CORRECT][/green] ", end="")
+        else:
+            rprint(r"[red]\[WRONG][/red]   ", end="")
+
+    else:
+        rprint(f"         {'':{ANSWER_LEN}s}           ", end="")
+
+    rprint(rf"[bright_white]{result.elapsed_ns / 1e6:9.3f}ms[/bright_white]")
+
+
+def print_corpus_summary(summary: "CorpusSummary") -> None:
+    """Print the totals and slowest inputs of a corpus run."""
+    rprint = get_console().print
+
+    rprint(
+        rf"Solved [bright_white]{summary.inputs}[/bright_white] inputs: "
+        rf"[green]{summary.correct} correct[/green], "
+        rf"[red]{summary.wrong} wrong[/red], "
+        rf"[red]{summary.failed} failed[/red], "
+        rf"{summary.unchecked} unchecked",
+    )
+    rprint(
+        rf"Took [bright_white]{summary.wall_ns / 1e9:.3f}s[/bright_white] for "
+        rf"[bright_white]{summary.input_bytes / 1e6:.2f}MB[/bright_white], "
+        rf"[bright_white]{summary.throughput / 1e6:.2f}MB/s[/bright_white]",
+    )
+
+    rprint("Slowest inputs:")
+    for result in summary.slowest:
+        rprint(
+            rf"    [blue]{result.name}[/blue] "
+            rf"[bright_white]{result.elapsed_ns / 1e6:.3f}ms[/bright_white]",
+        )
+
 
 if __name__ == "__main__":
     sys.exit(cli())
@@ -0,0 +1,182 @@
+"""Time puzzle solutions."""
+
+import logging
+import math
+import statistics
+import time
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
+
+from aoc2023.data import get_puzzle_generator, get_puzzle_inputs, get_puzzle_solution
+from aoc2023.profiling import ProfileOptions, profile_call
+from aoc2023.runner import Job
+
+WARMUP_RUNS = 1
+MIN_RUNS = 5
+MAX_RUNS = 1000
+MIN_TIME_NS = 500_000_000
+
+SCALE_MIN_SIZE = 10
+SCALE_FACTOR = 10
+
+
+class BenchStats(NamedTuple):
+    """Timing statistics for a Job."""
+
+    day: int
+    part: str
+    test: bool
+    seq: int
+    runs: int
+    min_ns: int
+    median_ns: int
+    p95_ns: int
+    input_bytes: int
+
+    @property
+    def throughput(self) -> float:
+        """Input bytes processed per second, at the median time."""
+        return self.input_bytes * 1_000_000_000 / max(self.median_ns, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**self._asdict(), "throughput": self.throughput}
+
+
+class ScaleStats(NamedTuple):
+    """Timing and memory statistics for one size of generated input."""
+
+    day: int
+    part: str
+    size: int
+    runs: int
+    median_ns: int
+    peak_memory: Optional[int]
+    input_bytes: int
+
+    @property
+    def throughput(self) -> float:
+        """Input bytes processed per second, at the median time."""
+        return self.input_bytes * 1_000_000_000 / max(self.median_ns, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**self._asdict(), "throughput": self.throughput}
+
+
+class BenchOptions(NamedTuple):
+    """
+    How many times to run a solution when timing it.
+
+    Runs are repeated until at least `min_runs` have been timed and they have
+    taken at least `min_time_ns` in total, or until `max_runs` is reached.
+    """
+
+    warmup: int = WARMUP_RUNS
+    min_runs: int = MIN_RUNS
+    max_runs: int = MAX_RUNS
+    min_time_ns: int = MIN_TIME_NS
+
+
+def time_solution(
+    solution: Callable[[str], Any],
+    input_: str,
+    options: Optional[BenchOptions] = None,
+) -> list[int]:
+    """Repeatedly time a solution, returning the duration of each run."""
+    options = options or BenchOptions()
+
+    for _ in range(options.warmup):
+        solution(input_)
+
+    samples: list[int] = []
+    total = 0
+
+    while len(samples) < options.max_runs and (
+        len(samples) < options.min_runs or total < options.min_time_ns
+    ):
+        start = time.perf_counter_ns()
+        solution(input_)
+        elapsed = time.perf_counter_ns() - start
+
+        samples.append(elapsed)
+        total += elapsed
+
+    return samples
+
+
+def bench_job(job: Job, options: Optional[BenchOptions] = None) -> BenchStats:
+    """Time the solution to a Job."""
+    logger = logging.getLogger(__name__)
+
+    example = get_puzzle_inputs(job.day, job.part, job.test)[job.seq]
+    solution = get_puzzle_solution(job.day, job.part)
+
+    samples = sorted(time_solution(solution, example.input, options))
+    logger.debug("Timed %s in %s runs", job, len(samples))
+
+    return BenchStats(
+        *job,
+        runs=len(samples),
+        min_ns=samples[0],
+        median_ns=statistics.median_low(samples),
+        p95_ns=samples[math.ceil(len(samples) * 0.95) - 1],
+        input_bytes=len(example.input.encode("utf-8")),
+    )
+
+
+def scale_sizes(
+    max_size: int,
+    min_size: int = SCALE_MIN_SIZE,
+    factor: int = SCALE_FACTOR,
+) -> list[int]:
+    """Return a geometric series of input sizes, up to and including `max_size`."""
+    sizes: list[int] = []
+    size = min(min_size, max_size)
+
+    while size < max_size:
+        sizes.append(size)
+        size *= factor
+
+    sizes.append(max_size)
+    return sizes
+
+
+def bench_scaling(
+    day: int,
+    part: str,
+    sizes: Iterable[int],
+    seed: int = 0,
+    options: Optional[BenchOptions] = None,
+) -> Iterator[ScaleStats]:
+    """
+    Time a solution over generated inputs of each size.
+
+    Peak memory is measured in a separate, untimed run, since tracing
+    allocations slows the solution down.
+    """
+    logger = logging.getLogger(__name__)
+
+    generate = get_puzzle_generator(day)
+    if generate is None:
+        raise ValueError(f"Day {day} has no input generator")
+
+    solution = get_puzzle_solution(day, part)
+
+    for size in sizes:
+        input_ = generate(size, seed)
+
+        samples = sorted(time_solution(solution, input_, options))
+        _, report = profile_call(
+            partial(solution, input_),
+            options=ProfileOptions(memory=True),
+        )
+        logger.debug("Timed day %s part %s at size %s", day, part, size)
+
+        yield ScaleStats(
+            day,
+            part,
+            size,
+            runs=len(samples),
+            median_ns=statistics.median_low(samples),
+            peak_memory=report.peak_memory,
+            input_bytes=len(input_.encode("utf-8")),
+        )
@@ -0,0 +1,172 @@
+"""On-disk cache of computed answers."""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import sqlite3
+import time
+from functools import cache
+from pathlib import Path
+from types import TracebackType
+from typing import NamedTuple, Optional
+
+from aoc2023.data import DAY_SUBMODULE_FMT, YEAR
+
+CACHE_FILENAME = "answers.sqlite3"
+CACHE_MAX_ENTRIES = 10_000
+
+
+class CacheKey(NamedTuple):
+    """Identifies an answer by the exact input and solution that produced it."""
+
+    day: int
+    part: str
+    input_hash: str
+    solution_hash: str
+
+
+def get_cache_dir() -> Path:
+    """Return the directory for this package's caches, following XDG conventions."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / f"aoc{YEAR}"
+
+
+def get_cache_path() -> Path:
+    """Return the location of the answer cache."""
+    return get_cache_dir() / CACHE_FILENAME
+
+
+@cache
+def _solution_path(day: int) -> Path:
+    sm = f"aoc{YEAR}.{DAY_SUBMODULE_FMT.format(day)}.solution"
+    spec = importlib.util.find_spec(sm)
+
+    if spec is None or spec.origin is None:
+        raise ValueError(f"No solution module found for day {day}")
+
+    return Path(spec.origin)
+
+
+# Hashes of files, by path, along with the mtime and size they were taken at
+_file_hashes: dict[Path, tuple[int, int, str]] = {}
+
+
+def file_hash(path: Path) -> str:
+    """Hash a file's contents, only reading it again if it has changed."""
+    stat = path.stat()
+
+    known = _file_hashes.get(path)
+    if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+        return known[2]
+
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    _file_hashes[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def solution_hash(day: int) -> str:
+    """Hash the source of a day's solution module."""
+    return file_hash(_solution_path(day))
+
+
+def cache_key(day: int, part: str, input_: str) -> CacheKey:
+    return CacheKey(
+        day,
+        part.upper(),
+        hashlib.sha256(input_.encode("utf-8")).hexdigest(),
+        solution_hash(day),
+    )
+
+
+class AnswerCache:
+    """
+    A size-bounded, least-recently-used cache of answers stored in SQLite.
+
+    Use as a context manager, or call open() and close(); the database is
+    opened on entry and closed on exit.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_entries: int = CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.path = path or get_cache_path()
+        self.max_entries = max_entries
+        self._db: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> "AnswerCache":
+        return self.open()
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def open(self) -> "AnswerCache":  # noqa: A003
+        """Open the database, creating it if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            " day INTEGER, part TEXT, input_hash TEXT, solution_hash TEXT,"
+            " answer INTEGER, last_used REAL,"
+            " PRIMARY KEY (day, part, input_hash, solution_hash))",
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS answers_last_used ON answers (last_used)",
+        )
+
+        return self
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            raise RuntimeError("AnswerCache must be opened first")
+
+        return self._db
+
+    def get(self, key: CacheKey) -> Optional[int]:
+        """Return the cached answer for a key, or None if there isn't one."""
+        where = "day = ? AND part = ? AND input_hash = ? AND solution_hash = ?"
+
+        row = self.db.execute(
+            f"SELECT answer FROM answers WHERE {where}",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+
+        self.db.execute(
+            f"UPDATE answers SET last_used = ? WHERE {where}",
+            (time.time(), *key),
+        )
+        return int(row[0])
+
+    def put(self, key: CacheKey, answer: int) -> None:
+        """Save an answer, evicting the least recently used if the cache is full."""
+        logger = logging.getLogger(__name__)
+
+        self.db.execute(
+            "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)",
+            (*key, answer, time.time()),
+        )
+
+        evicted = self.db.execute(
+            "DELETE FROM answers WHERE rowid NOT IN"
+            " (SELECT rowid FROM answers ORDER BY last_used DESC LIMIT ?)",
+            (self.max_entries,),
+        ).rowcount
+
+        if evicted > 0:
+            logger.debug("Evicted %s answers from the cache", evicted)
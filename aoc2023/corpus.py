@@ -0,0 +1,200 @@
+"""Run one day's solution across a directory of many inputs."""
+
+import heapq
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
+
+from aoc2023.data import COMPRESSION_SUFFIXES, decompress_stream, get_puzzle_solution
+
+CORPUS_SLOWEST = 5
+
+
+class CorpusResult(NamedTuple):
+    """The answer computed for one input in a corpus."""
+
+    name: str
+    answer: Optional[int]
+    expected: Optional[int]
+    elapsed_ns: int
+    input_bytes: int
+    error: Optional[str] = None
+
+    @property
+    def correct(self) -> Optional[bool]:
+        """Whether the answer is correct, or None if it isn't known."""
+        if self.expected is None or self.error is not None:
+            return None
+
+        return self.answer == self.expected
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**self._asdict(), "correct": self.correct}
+
+
+class CorpusSummary(NamedTuple):
+    """Totals across every input in a corpus."""
+
+    inputs: int
+    correct: int
+    wrong: int
+    failed: int
+    input_bytes: int
+    wall_ns: int
+    slowest: list[CorpusResult]
+
+    @property
+    def unchecked(self) -> int:
+        return self.inputs - self.correct - self.wrong - self.failed
+
+    @property
+    def throughput(self) -> float:
+        """Input bytes processed per second of wall-clock time, across workers."""
+        return self.input_bytes * 1_000_000_000 / max(self.wall_ns, 1)
+
+
+class CorpusOptions(NamedTuple):
+    """Where to find a corpus's expected answers, and how to run it."""
+
+    answers_path: Optional[Path] = None
+    workers: int = 1
+
+
+def list_corpus(corpus_dir: Path, exclude: Iterable[Path] = ()) -> list[Path]:
+    """
+    List the input files in a corpus directory, in name order.
+
+    Hidden files, and any files in `exclude` such as the corpus's answers, are
+    skipped.
+    """
+    excluded = {p.resolve() for p in exclude}
+
+    return sorted(
+        p
+        for p in corpus_dir.iterdir()
+        if p.is_file() and not p.name.startswith(".") and p.resolve() not in excluded
+    )
+
+
+def load_answers(answers_path: Path, part: str) -> dict[str, int]:
+    """
+    Load the expected answers for a corpus from a JSON file.
+
+    The file maps each input's filename to either its answer, or an object of
+    answers keyed by part.
+    """
+    with open(answers_path, encoding="utf-8") as answers_fh:
+        raw = json.load(answers_fh)
+
+    answers: dict[str, int] = {}
+
+    for name, value in raw.items():
+        answer = value.get(part.upper()) if isinstance(value, dict) else value
+        if answer is not None:
+            answers[name] = int(answer)
+
+    return answers
+
+
+def read_corpus_input(path: Path) -> str:
+    """Read one input from a corpus, decompressing it if needed."""
+    suffix = path.suffix if path.suffix in COMPRESSION_SUFFIXES else ""
+
+    with open(path, "rb") as raw_fh, decompress_stream(raw_fh, suffix) as input_fh:
+        return input_fh.read().decode("utf-8").strip()
+
+
+# Set once per worker by init_worker(), so each input doesn't import the
+# solution again
+_solution: Optional[Callable[[Any], Optional[int]]] = None
+_answers: dict[str, int] = {}
+
+
+def init_worker(day: int, part: str, answers: dict[str, int]) -> None:
+    """Import the solution and load the answers in this process."""
+    global _solution, _answers  # noqa: PLW0603
+
+    _solution = get_puzzle_solution(day, part)
+    _answers = answers
+
+
+def solve_input(path: Path) -> CorpusResult:
+    """Compute the answer to one input; errors are recorded, not raised."""
+    if _solution is None:
+        raise RuntimeError("init_worker() must be called first")
+
+    expected = _answers.get(path.name)
+    input_bytes = 0
+    start = time.perf_counter_ns()
+
+    try:
+        input_ = read_corpus_input(path)
+        input_bytes = len(input_.encode("utf-8"))
+
+        start = time.perf_counter_ns()
+        answer = _solution(input_) or 0
+    except Exception as e:  # One bad input shouldn't stop the whole corpus
+        elapsed = time.perf_counter_ns() - start
+        return CorpusResult(path.name, None, expected, elapsed, input_bytes, repr(e))
+
+    elapsed = time.perf_counter_ns() - start
+    return CorpusResult(path.name, answer, expected, elapsed, input_bytes)
+
+
+def run_corpus(
+    day: int,
+    part: str,
+    paths: Iterable[Path],
+    answers: Optional[dict[str, int]] = None,
+    workers: int = 1,
+) -> Iterator[CorpusResult]:
+    """
+    Compute the answer to every input, yielding Results in the same order.
+
+    Args:
+        day (int): The day to run.
+        part (str): The part to run.
+        paths (Iterable[Path]): The input files.
+        answers (dict[str, int], optional): Expected answers, by filename.
+        workers (int, optional): The number of processes to compute answers
+            in. 1 computes them in this process; 0 uses one process per CPU.
+            Defaults to 1.
+    """
+    logger = logging.getLogger(__name__)
+    init_args = (day, part, answers or {})
+
+    if workers == 1:
+        init_worker(*init_args)
+        yield from map(solve_input, paths)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    logger.debug("Computing corpus with %s workers", workers or "all")
+    with ProcessPoolExecutor(
+        max_workers=workers or None,
+        initializer=init_worker,
+        initargs=init_args,
+    ) as pool:
+        yield from pool.map(solve_input, paths)
+
+
+def summarize(
+    results: Iterable[CorpusResult],
+    wall_ns: int,
+    slowest: int = CORPUS_SLOWEST,
+) -> CorpusSummary:
+    """Total up a corpus run, keeping the slowest inputs."""
+    results = list(results)
+
+    return CorpusSummary(
+        inputs=len(results),
+        correct=sum(r.correct is True for r in results),
+        wrong=sum(r.correct is False for r in results),
+        failed=sum(r.error is not None for r in results),
+        input_bytes=sum(r.input_bytes for r in results),
+        wall_ns=wall_ns,
+        slowest=heapq.nlargest(slowest, results, key=lambda r: r.elapsed_ns),
+    )
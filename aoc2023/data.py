@@ -2,10 +2,27 @@
 
 import importlib.resources
 import importlib.util
+import io
 import logging
-from typing import Callable, NamedTuple, Optional
-
-import aoc2023
+import mmap
+import sys
+from contextlib import contextmanager, suppress
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+    cast,
+)
+
+from aoc2023.manifest import SOLUTIONS
+
+if TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
 
 YEAR = 2023
 
@@ -17,6 +34,10 @@ PART_NAMES = ("A", "B")
 
 PUZZLE_INPUT_FILENAME = "input.data"
 
+# Compressed inputs are found by adding one of these to the filename; they are
+# tried in order, after the uncompressed input
+COMPRESSION_SUFFIXES = (".gz", ".xz", ".zst")
+
 
 class Example(NamedTuple):
     """Puzzle solution example."""
@@ -25,22 +46,105 @@ class Example(NamedTuple):
     solution: Optional[int]
 
 
+def get_puzzle_input_path(day: int) -> "Traversable":
+    """
+    Return the location of that day's input.
+
+    If there is no uncompressed input, the first compressed one found is used
+    instead.
+    """
+    day_files = importlib.resources.files(f"aoc{YEAR}.{DAY_SUBMODULE_FMT.format(day)}")
+    path = day_files / PUZZLE_INPUT_FILENAME
+
+    if not path.is_file():
+        for suffix in COMPRESSION_SUFFIXES:
+            compressed_path = day_files / f"{PUZZLE_INPUT_FILENAME}{suffix}"
+            if compressed_path.is_file():
+                return compressed_path
+
+    return path
+
+
+def decompress_stream(fh: IO[bytes], suffix: str) -> IO[bytes]:
+    """Wrap a binary file so that it is decompressed as it is read."""
+    if suffix == ".gz":
+        import gzip
+
+        return cast("IO[bytes]", gzip.GzipFile(fileobj=fh, mode="rb"))
+
+    if suffix == ".xz":
+        import lzma
+
+        return cast("IO[bytes]", lzma.LZMAFile(fh))
+
+    if suffix == ".zst":
+        try:
+            import zstandard  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ValueError("Reading .zst inputs needs the zstandard package") from e
+
+        return zstandard.ZstdDecompressor().stream_reader(fh)  # type: ignore[no-any-return]
+
+    return fh
+
+
+@contextmanager
+def open_puzzle_input(day: int, binary: bool = False) -> Iterator[IO[Any]]:
+    """
+    Open that day's input, as text unless `binary` is set.
+
+    Compressed inputs are decompressed as they are read, so the start of the
+    input can be used before the rest has been decompressed.
+    """
+    path = get_puzzle_input_path(day)
+    suffix = path.name[len(PUZZLE_INPUT_FILENAME) :]
+
+    with path.open("rb") as raw_fh, decompress_stream(raw_fh, suffix) as binary_fh:
+        yield binary_fh if binary else io.TextIOWrapper(binary_fh, encoding="utf-8")
+
+
 def get_puzzle_input(day: int) -> str:
     """Extract that day's input and return it as a string."""
-    puzzle_input_path = (
-        importlib.resources.files(
-            getattr(aoc2023, DAY_SUBMODULE_FMT.format(day)),
-        )
-        / PUZZLE_INPUT_FILENAME
-    )
-
-    with puzzle_input_path.open("rt", encoding="utf-8") as input_fh:
+    with open_puzzle_input(day) as input_fh:
         return input_fh.read().strip()
 
 
-def days_with_solutions() -> list[int]:
-    """Identify which days have solutions."""
-    logger = logging.getLogger(__name__)
+def lazy_puzzle_input(module_name: str, day: int) -> Callable[[str], str]:
+    """
+    Build a module `__getattr__` that loads `PUZZLE_INPUT` on first access.
+
+    The input is saved on the module once loaded, so it is only read once and
+    importing a day's data never touches the disk.
+    """
+
+    def __getattr__(name: str) -> str:  # noqa: N807
+        if name != "PUZZLE_INPUT":
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        puzzle_input = get_puzzle_input(day)
+        setattr(sys.modules[module_name], name, puzzle_input)
+        return puzzle_input
+
+    return __getattr__
+
+
+def iter_puzzle_input(day: int) -> Iterator[str]:
+    """Yield that day's input one line at a time, without line endings."""
+    with open_puzzle_input(day) as input_fh:
+        for line in input_fh:
+            yield line.rstrip("\r\n")
+
+
+def discover_solutions() -> dict[int, tuple[str, ...]]:
+    """
+    Find every day and part with a solution by importing each day's data.
+
+    This is slow, so it is only used to generate the solution manifest.
+    """
+    return {day: tuple(_probe_day_parts(day)) for day in _probe_days()}
+
+
+def _probe_days() -> list[int]:
     days: list[int] = []
 
     for d in range(DAY_COUNT_MIN, DAY_COUNT_MAX + 1):
@@ -48,12 +152,10 @@ def days_with_solutions() -> list[int]:
         if importlib.util.find_spec(f"aoc{YEAR}.{m}"):
             days.append(d)
 
-    logger.debug("Available days: %s", days)
     return days
 
 
-def day_parts_with_solutions(day: int) -> list[str]:
-    """Identify which parts of a day have solutions."""
+def _probe_day_parts(day: int) -> list[str]:
     logger = logging.getLogger(__name__)
     parts: list[str] = []
 
@@ -62,13 +164,11 @@ def day_parts_with_solutions(day: int) -> list[str]:
     sm = f"aoc{YEAR}.{dm}.data"
 
     try:
-        importlib.import_module(sm)
+        data_module = importlib.import_module(sm)
     except ImportError:
         logger.debug("Could not import day %s submodule %s", day, sm)
         return []
 
-    data_module = getattr(globals()[f"aoc{YEAR}"], dm).data
-
     for p in PART_NAMES:
         part_examples_name = f"PART_{p.upper()}_EXAMPLES"
         if hasattr(data_module, part_examples_name):
@@ -87,6 +187,78 @@ def day_parts_with_solutions(day: int) -> list[str]:
         )
         break
 
+    return parts
+
+
+@contextmanager
+def map_puzzle_input(day: int) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Memory-map that day's input and provide it as a read-only bytes-like buffer.
+
+    Nothing is decoded or copied; pages are read from the page cache as they
+    are used. Views of the buffer, such as the lines from iter_lines(), may
+    outlive the context, such as the last line of a for loop; the mapping is
+    then only closed once they have been garbage collected.
+
+    Compressed inputs can't be mapped, so they are decompressed into memory
+    instead.
+    """
+    input_path = get_puzzle_input_path(day)
+    if input_path.name != PUZZLE_INPUT_FILENAME:
+        with open_puzzle_input(day, binary=True) as compressed_fh:
+            yield compressed_fh.read()
+        return
+
+    with importlib.resources.as_file(input_path) as path:
+        # Empty files can't be mapped
+        if path.stat().st_size == 0:
+            yield b""
+            return
+
+        with open(path, "rb") as input_fh:
+            buffer = mmap.mmap(input_fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            yield buffer
+        finally:
+            # Raised while views of the buffer are still alive
+            with suppress(BufferError):
+                buffer.close()
+
+
+def iter_lines(buffer: Union[mmap.mmap, bytes]) -> Iterator[memoryview]:
+    """Yield each line of a buffer as a zero-copy view, without line endings."""
+    view = memoryview(buffer)
+    start = 0
+    size = len(buffer)
+
+    while start < size:
+        end = buffer.find(b"\n", start)
+        if end < 0:
+            end = size
+
+        line_end = end
+        if line_end > start and view[line_end - 1] == ord("\r"):
+            line_end -= 1
+
+        yield view[start:line_end]
+        start = end + 1
+
+
+def days_with_solutions() -> list[int]:
+    """Identify which days have solutions."""
+    logger = logging.getLogger(__name__)
+    days = sorted(SOLUTIONS)
+
+    logger.debug("Available days: %s", days)
+    return days
+
+
+def day_parts_with_solutions(day: int) -> list[str]:
+    """Identify which parts of a day have solutions."""
+    logger = logging.getLogger(__name__)
+    parts = list(SOLUTIONS.get(day, ()))
+
     logger.debug("Available parts: %s", parts)
     return parts
 
@@ -94,25 +266,48 @@ def day_parts_with_solutions(day: int) -> list[str]:
 def get_puzzle_solution(
     day: int,
     part: str,
-) -> Callable[[str], int]:
+) -> Callable[[Any], int]:
     """Return the solution method for the specified day and part."""
     dm = DAY_SUBMODULE_FMT.format(day)
     sm = f"aoc{YEAR}.{dm}.solution"
     fn = f"part_{part.lower()}_solution"
 
-    importlib.import_module(sm)
-    solutions_module = getattr(globals()[f"aoc{YEAR}"], dm).solution
+    solutions_module = importlib.import_module(sm)
 
     return getattr(solutions_module, fn)
 
 
+def get_puzzle_parser(day: int) -> Optional[Callable[[str], Any]]:
+    """Return the day's optional `parse` hook shared by both parts, if any."""
+    dm = DAY_SUBMODULE_FMT.format(day)
+    sm = f"aoc{YEAR}.{dm}.solution"
+
+    solutions_module = importlib.import_module(sm)
+
+    return getattr(solutions_module, "parse", None)
+
+
+def get_puzzle_generator(day: int) -> Optional[Callable[..., str]]:
+    """Return the day's synthetic input generator, if it has one."""
+    dm = DAY_SUBMODULE_FMT.format(day)
+    gm = f"aoc{YEAR}.{dm}.generate"
+
+    try:
+        generate_module = importlib.import_module(gm)
+    except ModuleNotFoundError as e:
+        if e.name != gm:
+            raise
+        return None
+
+    return getattr(generate_module, "generate", None)
+
+
 def get_puzzle_inputs(day: int, part: str, test: bool = False) -> list[Example]:
     """Return the input for the specified day and part."""
     dm = DAY_SUBMODULE_FMT.format(day)
     sm = f"aoc{YEAR}.{dm}.data"
 
-    importlib.import_module(sm)
-    data_module = getattr(globals()[f"aoc{YEAR}"], dm).data
+    data_module = importlib.import_module(sm)
 
     if test:
         part_examples_name = f"PART_{part.upper()}_EXAMPLES"
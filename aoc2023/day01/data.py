@@ -1,6 +1,6 @@
 """AOC 2023 Day 1 example data and input functions."""
 
-from aoc2023.data import Example, get_puzzle_input
+from aoc2023.data import Example, lazy_puzzle_input
 
 # Adding examples to a part's list signals to the system that the part is
 # ready for testing
@@ -30,7 +30,9 @@ zoneight234
     ),
 ]
 
-PUZZLE_INPUT = get_puzzle_input(1)
+# Loaded from disk on first access
+PUZZLE_INPUT: str
+__getattr__ = lazy_puzzle_input(__name__, 1)
 
 PUZZLE_ANSWER_A: int | None = 56465
 PUZZLE_ANSWER_B: int | None = 55902
@@ -0,0 +1,31 @@
+"""AOC 2023 Day 1 synthetic input generator."""
+
+import random
+import string
+
+from aoc2023.day01.solution import NUMBERS
+
+
+def generate(lines: int, seed: int = 0) -> str:
+    """Generate a valid input with the given number of calibration lines."""
+    rng = random.Random(seed)
+    words = list(NUMBERS)
+    out: list[str] = []
+
+    for _ in range(lines):
+        chunks = [
+            rng.choice(
+                (
+                    rng.choice(string.digits[1:]),
+                    rng.choice(words),
+                    "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 4))),
+                ),
+            )
+            for _ in range(rng.randint(1, 8))
+        ]
+
+        # Part A needs at least one digit on every line
+        chunks.insert(rng.randint(0, len(chunks)), rng.choice(string.digits[1:]))
+        out.append("".join(chunks))
+
+    return "\n".join(out)
@@ -1,6 +1,7 @@
 """AOC 2023 Day 1 solutions."""
 
-from typing import Optional
+import re
+from typing import Iterable, Optional
 
 NUMBERS = {
     "one": 1,
@@ -14,60 +15,72 @@ NUMBERS = {
     "nine": 9,
 }
 
+DIGITS = {str(value): value for value in range(10)}
 
-def part_a_solution(input_: str) -> Optional[int]:
-    """Compute the solution to a Part A input."""
-    assert len(input_) > 0
+WORDS = DIGITS | NUMBERS
+WORDS_REVERSED = DIGITS | {name[::-1]: value for name, value in NUMBERS.items()}
 
-    total = 0
-    for line in input_.splitlines():
-        if len(line) <= 0:
-            continue
+RE_DIGIT = re.compile(r"\d")
+RE_WORD = re.compile("|".join(WORDS))
+RE_WORD_REVERSED = re.compile("|".join(WORDS_REVERSED))
 
-        digits = [c for c in line.strip().lower() if c.isdigit()]
-        calibration = digits[0] + digits[-1]
-        value = int(calibration)
 
-        total += value
+def calibration_value(line: str, spelled: bool = False) -> int:
+    """
+    Find the first and last digit in a line and combine them.
 
-    return total
+    The last digit is found by searching the reversed line for reversed names,
+    so overlapping names like "eightwo" give both 8 and 2.
+    """
+    if not spelled:
+        first = RE_DIGIT.search(line)
+        last = RE_DIGIT.search(line[::-1])
+        assert first is not None
+        assert last is not None
 
+        return DIGITS[first.group(0)] * 10 + DIGITS[last.group(0)]
 
-def part_b_solution(input_: str) -> Optional[int]:
-    """Compute the solution to a Part B input."""
-    assert len(input_) > 0
+    first = RE_WORD.search(line)
+    last = RE_WORD_REVERSED.search(line[::-1])
+    assert first is not None
+    assert last is not None
 
+    return WORDS[first.group(0)] * 10 + WORDS_REVERSED[last.group(0)]
+
+
+def part_a_stream(lines: Iterable[str]) -> int:
+    """Compute the Part A solution one line at a time."""
     total = 0
-    for line in input_.splitlines():
+    for raw_line in lines:
+        line = raw_line.strip()
         if len(line) <= 0:
             continue
 
-        trans = convert_numbers(line)
+        total += calibration_value(line)
 
-        digits = [c for c in trans.strip().lower() if c.isdigit()]
-        calibration = digits[0] + digits[-1]
-        value = int(calibration)
+    return total
 
-        total += value
 
-    return total
+def part_b_stream(lines: Iterable[str]) -> int:
+    """Compute the Part B solution one line at a time."""
+    total = 0
+    for raw_line in lines:
+        line = raw_line.strip()
+        if len(line) <= 0:
+            continue
 
+        total += calibration_value(line, spelled=True)
 
-def convert_numbers(line: str) -> str:
-    """Convert spelled-out numbers into digits."""
-    parts: list[str] = []
+    return total
 
-    for x in range(len(line)):
-        found = False
-        for name, value in NUMBERS.items():
-            if line[x:].startswith(name):
-                parts.append(str(value))
-                found = True
-                break
 
-        if found:
-            continue
+def part_a_solution(input_: str) -> Optional[int]:
+    """Compute the solution to a Part A input."""
+    assert len(input_) > 0
+    return part_a_stream(input_.splitlines())
 
-        parts.append(line[x])
 
-    return "".join(parts)
+def part_b_solution(input_: str) -> Optional[int]:
+    """Compute the solution to a Part B input."""
+    assert len(input_) > 0
+    return part_b_stream(input_.splitlines())
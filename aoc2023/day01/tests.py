@@ -1,9 +1,21 @@
 """AOC 2023 Day 1 example tests."""
 
+import io
+from typing import Callable, Iterable
+
 import pytest
 
 from aoc2023.day01.data import PART_A_EXAMPLES, PART_B_EXAMPLES
-from aoc2023.day01.solution import part_a_solution, part_b_solution
+from aoc2023.day01.generate import generate
+from aoc2023.day01.solution import (
+    DIGITS,
+    NUMBERS,
+    calibration_value,
+    part_a_solution,
+    part_a_stream,
+    part_b_solution,
+    part_b_stream,
+)
 
 
 @pytest.mark.parametrize(
@@ -28,3 +40,66 @@ def test_example_a(given: str, expected: int) -> None:
 def test_example_b(given: str, expected: int) -> None:
     """Test the part a solution on the given example."""
     assert part_b_solution(given) == expected
+
+
+@pytest.mark.parametrize(
+    ("given", "expected"),
+    [
+        ("eightwo", 82),
+        ("oneight", 18),
+        ("twone", 21),
+        ("7pqrstsixteen", 76),
+        ("xx5xx", 55),
+    ],
+)
+def test_calibration_value_spelled(given: str, expected: int) -> None:
+    """Test that overlapping spelled-out numbers are found from both ends."""
+    assert calibration_value(given, spelled=True) == expected
+
+
+@pytest.mark.parametrize(
+    ("stream", "given", "expected"),
+    [
+        pytest.param(part_a_stream, example.input, example.solution, id=f"a{seq:02d}")
+        for seq, example in enumerate(PART_A_EXAMPLES)
+    ]
+    + [
+        pytest.param(part_b_stream, example.input, example.solution, id=f"b{seq:02d}")
+        for seq, example in enumerate(PART_B_EXAMPLES)
+    ],
+)
+def test_example_stream(
+    stream: Callable[[Iterable[str]], int],
+    given: str,
+    expected: int,
+) -> None:
+    """Test the streaming solutions on the given example read as a file."""
+    assert stream(io.StringIO(given)) == expected
+
+
+def calibration_value_naive(line: str, spelled: bool = False) -> int:
+    """Find every digit by trying each word at each position in the line."""
+    words = DIGITS | NUMBERS if spelled else DIGITS
+    digits = [
+        value
+        for idx in range(len(line))
+        for word, value in words.items()
+        if line.startswith(word, idx)
+    ]
+
+    return digits[0] * 10 + digits[-1]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_generated(seed: int) -> None:
+    """Test every solution against a naive one on a generated input."""
+    given = generate(200, seed)
+    lines = given.splitlines()
+
+    expected_a = sum(calibration_value_naive(line) for line in lines)
+    expected_b = sum(calibration_value_naive(line, spelled=True) for line in lines)
+
+    assert part_a_solution(given) == expected_a
+    assert part_a_stream(io.StringIO(given)) == expected_a
+    assert part_b_solution(given) == expected_b
+    assert part_b_stream(io.StringIO(given)) == expected_b
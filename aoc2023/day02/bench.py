@@ -0,0 +1,42 @@
+"""AOC 2023 Day 2 parser benchmark."""
+
+import sys
+from typing import Any, Callable
+
+from aoc2023.bench import BenchOptions, time_solution
+from aoc2023.day02.generate import generate
+from aoc2023.day02.solution import Game, GameTable
+
+BENCH_GAMES = 100_000
+BENCH_OPTIONS = BenchOptions(min_runs=3, min_time_ns=0)
+
+
+def parse_games(input_: str) -> list[Any]:
+    return [Game.parse(line).maximums for line in input_.splitlines()]
+
+
+def parse_table(input_: str) -> GameTable:
+    return GameTable.parse(input_.splitlines())
+
+
+PARSERS: dict[str, Callable[[str], Any]] = {
+    "Game.parse": parse_games,
+    "parse_maximums": parse_table,
+    "scan_draws": GameTable.scan,
+}
+
+
+def main(games: int = BENCH_GAMES) -> int:
+    """Time each way of parsing the same generated input."""
+    input_ = generate(games)
+    print(f"Parsing {games} games ({len(input_)} bytes)")
+
+    for name, parser in PARSERS.items():
+        samples = sorted(time_solution(parser, input_, BENCH_OPTIONS))
+        print(f"{name:>16s}: {samples[len(samples) // 2] / 1e6:10.3f}ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:])))
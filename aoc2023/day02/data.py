@@ -1,6 +1,6 @@
 """AOC 2023 Day 2 example data and input functions."""
 
-from aoc2023.data import Example, get_puzzle_input
+from aoc2023.data import Example, lazy_puzzle_input
 
 # Adding examples to a part's list signals to the system that the part is
 # ready for testing
@@ -29,7 +29,9 @@ Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green
     ),
 ]
 
-PUZZLE_INPUT: str = get_puzzle_input(2)
+# Loaded from disk on first access
+PUZZLE_INPUT: str
+__getattr__ = lazy_puzzle_input(__name__, 2)
 
 PUZZLE_ANSWER_A: int | None = 2105
 PUZZLE_ANSWER_B: int | None = 72422
@@ -0,0 +1,23 @@
+"""AOC 2023 Day 2 synthetic input generator."""
+
+import random
+
+COLORS = ("red", "green", "blue")
+
+
+def generate(games: int, seed: int = 0) -> str:
+    """Generate a valid input with the given number of games."""
+    rng = random.Random(seed)
+    lines: list[str] = []
+
+    for game_id in range(1, games + 1):
+        rounds = [
+            ", ".join(
+                f"{rng.randint(1, 20)} {color}"
+                for color in rng.sample(COLORS, rng.randint(1, len(COLORS)))
+            )
+            for _ in range(rng.randint(1, 6))
+        ]
+        lines.append(f"Game {game_id}: {'; '.join(rounds)}")
+
+    return "\n".join(lines)
@@ -1,7 +1,9 @@
 """AOC 2023 Day 2 solutions."""
 
+import re
+from array import array
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Union
 
 
 @dataclass
@@ -55,37 +57,157 @@ class Game:  # noqa: D101
         )
 
 
-def part_a_solution(input_: str) -> Optional[int]:
-    """Compute the solution to a Part A input."""
-    assert len(input_) > 0
+CUBE_LIMITS = RoundTotal(12, 13, 14)
+
+# A number followed by a color is a draw; any other number is a game ID
+RE_TOKEN = re.compile(r"(\d+)(?: ([rgb]))?")
+
+
+def scan_draws(input_: str) -> Iterator[tuple[int, str, int]]:
+    """Yield `(game_id, color, count)` for every draw, in one pass over the input."""
+    game_id = 0
+
+    for m in RE_TOKEN.finditer(input_):
+        number, color = m.groups()
+
+        if color is None:
+            game_id = int(number)
+        else:
+            yield game_id, color, int(number)
+
+
+def parse_maximums(line: str) -> tuple[int, int, int, int]:
+    """Reduce a game directly to its ID and the most of each color shown."""
+    game, info = line.split(":")
+    maxes = {"r": 0, "g": 0, "b": 0}
+
+    # Rounds don't matter for the maximums, so treat every draw the same
+    for draw in info.replace(";", ",").split(","):
+        num, name = draw.split()
+        color = name[0]
+        count = int(num)
+
+        if count > maxes[color]:
+            maxes[color] = count
+
+    return int(game.strip()[5:]), maxes["r"], maxes["g"], maxes["b"]
+
+
+@dataclass
+class GameTable:
+    """The ID and color maximums of every game, stored as columns."""
+
+    ids: array = field(default_factory=lambda: array("I"))
+    r: array = field(default_factory=lambda: array("I"))
+    g: array = field(default_factory=lambda: array("I"))
+    b: array = field(default_factory=lambda: array("I"))
+
+    def append(self, id_: int, r: int, g: int, b: int) -> None:
+        self.ids.append(id_)
+        self.r.append(r)
+        self.g.append(g)
+        self.b.append(b)
+
+    @classmethod
+    def parse(cls, lines: Iterable[str]) -> "GameTable":
+        table = cls()
+
+        for line in lines:
+            if len(line.strip()) <= 0:
+                continue
+
+            table.append(*parse_maximums(line))
 
-    maximums = RoundTotal(
-        12,
-        13,
-        14,
-    )
+        return table
+
+    @classmethod
+    def scan(cls, input_: str) -> "GameTable":
+        """Build the table from a whole input with scan_draws()."""
+        table = cls()
+        current, r, g, b = None, 0, 0, 0
+
+        for game_id, color, count in scan_draws(input_):
+            if game_id != current:
+                if current is not None:
+                    table.append(current, r, g, b)
+
+                current, r, g, b = game_id, 0, 0, 0
+
+            if color == "r":
+                if count > r:
+                    r = count
+            elif color == "g":
+                if count > g:
+                    g = count
+            elif count > b:
+                b = count
+
+        if current is not None:
+            table.append(current, r, g, b)
+
+        return table
+
+    def possible_total(self, limits: RoundTotal = CUBE_LIMITS) -> int:
+        """Sum the IDs of the games possible with the given numbers of cubes."""
+        return sum(
+            id_
+            for id_, r, g, b in zip(self.ids, self.r, self.g, self.b, strict=True)
+            if r <= limits.r and g <= limits.g and b <= limits.b
+        )
+
+    def total_power(self) -> int:
+        """Sum the products of each game's color maximums."""
+        return sum(r * g * b for r, g, b in zip(self.r, self.g, self.b, strict=True))
+
+
+def part_a_stream(lines: Iterable[str]) -> int:
+    """Compute the Part A solution one line at a time."""
+    limits = CUBE_LIMITS
 
     possible_total = 0
-    games = [Game.parse(line) for line in input_.splitlines()]
-    for g in games:
-        maxes = g.maximums
+    for line in lines:
+        if len(line.strip()) <= 0:
+            continue
+
+        id_, r, g, b = parse_maximums(line)
 
-        if maxes.r <= maximums.r and maxes.g <= maximums.g and maxes.b <= maximums.b:
-            possible_total += g.id_
+        if r <= limits.r and g <= limits.g and b <= limits.b:
+            possible_total += id_
 
     return possible_total
 
 
-def part_b_solution(input_: str) -> Optional[int]:
-    """Compute the solution to a Part B input."""
-    assert len(input_) > 0
-
+def part_b_stream(lines: Iterable[str]) -> int:
+    """Compute the Part B solution one line at a time."""
     total_power = 0
-    games = [Game.parse(line) for line in input_.splitlines()]
+    for line in lines:
+        if len(line.strip()) <= 0:
+            continue
 
-    for g in games:
-        m = g.maximums
-        power = m.r * m.g * m.b
-        total_power += power
+        _, r, g, b = parse_maximums(line)
+        total_power += r * g * b
 
     return total_power
+
+
+def parse(input_: str) -> GameTable:
+    """Parse an input once, so it can be shared by both parts."""
+    return GameTable.parse(input_.splitlines())
+
+
+def part_a_solution(input_: Union[str, GameTable]) -> Optional[int]:
+    """Compute the solution to a Part A input."""
+    if isinstance(input_, str):
+        assert len(input_) > 0
+        input_ = parse(input_)
+
+    return input_.possible_total()
+
+
+def part_b_solution(input_: Union[str, GameTable]) -> Optional[int]:
+    """Compute the solution to a Part B input."""
+    if isinstance(input_, str):
+        assert len(input_) > 0
+        input_ = parse(input_)
+
+    return input_.total_power()
@@ -1,9 +1,22 @@
 """AOC 2023 Day 2 example tests."""
 
+import io
+from typing import Any, Callable, Iterable
+
 import pytest
 
 from aoc2023.day02.data import PART_A_EXAMPLES, PART_B_EXAMPLES
-from aoc2023.day02.solution import part_a_solution, part_b_solution
+from aoc2023.day02.generate import generate
+from aoc2023.day02.solution import (
+    CUBE_LIMITS,
+    Game,
+    GameTable,
+    parse,
+    part_a_solution,
+    part_a_stream,
+    part_b_solution,
+    part_b_stream,
+)
 
 
 @pytest.mark.parametrize(
@@ -28,3 +41,80 @@ def test_example_a(given: str, expected: int) -> None:
 def test_example_b(given: str, expected: int) -> None:
     """Test the part a solution on the given example."""
     assert part_b_solution(given) == expected
+
+
+@pytest.mark.parametrize(
+    ("stream", "given", "expected"),
+    [
+        pytest.param(part_a_stream, example.input, example.solution, id=f"a{seq:02d}")
+        for seq, example in enumerate(PART_A_EXAMPLES)
+    ]
+    + [
+        pytest.param(part_b_stream, example.input, example.solution, id=f"b{seq:02d}")
+        for seq, example in enumerate(PART_B_EXAMPLES)
+    ],
+)
+def test_example_stream(
+    stream: Callable[[Iterable[str]], int],
+    given: str,
+    expected: int,
+) -> None:
+    """Test the streaming solutions on the given example read as a file."""
+    assert stream(io.StringIO(given)) == expected
+
+
+@pytest.mark.parametrize(
+    "given",
+    [
+        pytest.param(example.input, id=f"{seq:02d}")
+        for seq, example in enumerate(PART_A_EXAMPLES)
+    ],
+)
+def test_scan(given: str) -> None:
+    """Test that scanning the whole input matches parsing it line by line."""
+    assert GameTable.scan(given) == GameTable.parse(given.splitlines())
+
+
+@pytest.mark.parametrize(
+    ("solution", "given", "expected"),
+    [
+        pytest.param(part_a_solution, ex.input, ex.solution, id=f"a{seq:02d}")
+        for seq, ex in enumerate(PART_A_EXAMPLES)
+    ]
+    + [
+        pytest.param(part_b_solution, ex.input, ex.solution, id=f"b{seq:02d}")
+        for seq, ex in enumerate(PART_B_EXAMPLES)
+    ],
+)
+def test_example_parsed(
+    solution: Callable[[Any], int],
+    given: str,
+    expected: int,
+) -> None:
+    """Test the solutions on the given example parsed ahead of time."""
+    assert solution(parse(given)) == expected
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_generated(seed: int) -> None:
+    """Test every solution against the Game classes on a generated input."""
+    given = generate(200, seed)
+    games = [Game.parse(line) for line in given.splitlines()]
+
+    expected_a = sum(
+        game.id_
+        for game in games
+        if game.maximums.r <= CUBE_LIMITS.r
+        and game.maximums.g <= CUBE_LIMITS.g
+        and game.maximums.b <= CUBE_LIMITS.b
+    )
+    expected_b = sum(
+        game.maximums.r * game.maximums.g * game.maximums.b for game in games
+    )
+
+    assert part_a_solution(given) == expected_a
+    assert part_a_solution(parse(given)) == expected_a
+    assert part_a_stream(io.StringIO(given)) == expected_a
+    assert part_b_solution(given) == expected_b
+    assert part_b_solution(parse(given)) == expected_b
+    assert part_b_stream(io.StringIO(given)) == expected_b
@@ -1,6 +1,6 @@
 """AOC 2023 Day 3 example data and input functions."""
 
-from aoc2023.data import Example, get_puzzle_input
+from aoc2023.data import Example, lazy_puzzle_input
 
 # Adding examples to a part's list signals to the system that the part is
 # ready for testing
@@ -55,7 +55,9 @@ PART_B_EXAMPLES: list[Example] = [
     ),
 ]
 
-PUZZLE_INPUT = get_puzzle_input(3)
+# Loaded from disk on first access
+PUZZLE_INPUT: str
+__getattr__ = lazy_puzzle_input(__name__, 3)
 
 PUZZLE_ANSWER_A: int | None = 519444
 PUZZLE_ANSWER_B: int | None = 74528807
@@ -0,0 +1,39 @@
+"""AOC 2023 Day 3 synthetic input generator."""
+
+import random
+from typing import Optional
+
+SYMBOLS = "*#+$/@=%-&"
+
+NUMBER_DENSITY = 0.1
+SYMBOL_DENSITY = 0.04
+
+
+def generate(rows: int, seed: int = 0, cols: Optional[int] = None) -> str:
+    """Generate a valid schematic with the given number of rows and columns."""
+    rng = random.Random(seed)
+    cols = rows if cols is None else cols
+    lines: list[str] = []
+
+    for _ in range(rows):
+        cells: list[str] = []
+
+        while len(cells) < cols:
+            r = rng.random()
+
+            if r < NUMBER_DENSITY:
+                cells.extend(str(rng.randint(1, 999))[: cols - len(cells)])
+
+                # Keep the next number from running into this one
+                if len(cells) < cols:
+                    cells.append(".")
+
+            elif r < NUMBER_DENSITY + SYMBOL_DENSITY:
+                cells.append(rng.choice(SYMBOLS))
+
+            else:
+                cells.append(".")
+
+        lines.append("".join(cells))
+
+    return "\n".join(lines)
@@ -1,110 +1,227 @@
 """AOC 2023 Day 3 solutions."""
 
 import re
-from typing import Iterator, NamedTuple, Optional
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
 
+RE_NUMBER = re.compile(r"([\d]+)")
+RE_SYMBOL = re.compile(r"([^\d.])")
 
-class Coord(NamedTuple):
-    r: int
-    c: int
+NO_NUMBER = -1
 
-    def neighbors(self) -> Iterator["Coord"]:
-        yield self.__class__(self.r - 1, self.c - 1)
-        yield self.__class__(self.r + 0, self.c - 1)
-        yield self.__class__(self.r + 1, self.c - 1)
-        yield self.__class__(self.r - 1, self.c + 0)
-        yield self.__class__(self.r + 1, self.c + 0)
-        yield self.__class__(self.r - 1, self.c + 1)
-        yield self.__class__(self.r + 0, self.c + 1)
-        yield self.__class__(self.r + 1, self.c + 1)
 
+@dataclass
+class Schematic:
+    """
+    A flat index of the numbers and symbols in a schematic.
 
-class PartNumber(NamedTuple):
-    value: int
-    locs: tuple[Coord, ...]
+    Cells are numbered row by row. The grid is padded with an empty border, so
+    every neighbor of a real cell is `offset + d` for some `d` in `neighbors`,
+    without bounds checks.
+    """
 
+    width: int
+    values: list[int] = field(default_factory=list)
+    # For every cell, the index into `values` of the number there, if any
+    numbers: array = field(default_factory=lambda: array("i"))
+    symbols: list[int] = field(default_factory=list)
+    gears: list[int] = field(default_factory=list)
 
-RE_NUMBER = re.compile(r"([\d]+)")
-RE_SYMBOL = re.compile(r"([^\d.])")
+    @property
+    def neighbors(self) -> tuple[int, ...]:
+        w = self.width
+        return (-w - 1, -w, -w + 1, -1, 1, w - 1, w, w + 1)
+
+    @classmethod
+    def parse(cls, input_: str) -> "Schematic":
+        lines = [line.strip() for line in input_.splitlines()]
+        width = max((len(line) for line in lines), default=0) + 2
+
+        schematic = cls(width)
+        schematic.numbers = array("i", [NO_NUMBER]) * (width * (len(lines) + 2))
+
+        for row_no, line in enumerate(lines, start=1):
+            row_offset = row_no * width + 1
+
+            # Mark every cell a number occupies with that number's index
+            for m in RE_NUMBER.finditer(line):
+                number_id = len(schematic.values)
+                schematic.values.append(int(m.group(0)))
+
+                c_start, c_end = m.span(0)
+                schematic.numbers[row_offset + c_start : row_offset + c_end] = array(
+                    "i",
+                    [number_id],
+                ) * (c_end - c_start)
+
+            for m in RE_SYMBOL.finditer(line):
+                offset = row_offset + m.start(0)
+                schematic.symbols.append(offset)
+
+                if m.group(0) == "*":
+                    schematic.gears.append(offset)
+
+        return schematic
+
+    def adjacent(self, offset: int) -> set[int]:
+        """Return the indices of the distinct numbers next to a cell."""
+        numbers = self.numbers
+        found = {numbers[offset + d] for d in self.neighbors}
+        found.discard(NO_NUMBER)
+        return found
+
+
+class Row(NamedTuple):
+    """The numbers and symbols in a single row of a schematic."""
+
+    values: list[int]
+    # For every column, the index into `values` of the number there, if any
+    numbers: array
+    symbols: list[int]
+    gears: list[int]
+    # Whether each number has already been counted as a part number
+    counted: bytearray
+
+    @classmethod
+    def parse(cls, line: str) -> "Row":
+        line = line.strip()
+        row = cls([], array("i", [NO_NUMBER]) * len(line), [], [], bytearray())
+
+        for m in RE_NUMBER.finditer(line):
+            number_id = len(row.values)
+            row.values.append(int(m.group(0)))
+
+            c_start, c_end = m.span(0)
+            row.numbers[c_start:c_end] = array("i", [number_id]) * (c_end - c_start)
+
+        for m in RE_SYMBOL.finditer(line):
+            row.symbols.append(m.start(0))
 
-PartNumberLog = dict[Coord, PartNumber]
-SymbolLog = dict[Coord, str]
+            if m.group(0) == "*":
+                row.gears.append(m.start(0))
 
+        row.counted.extend(bytes(len(row.values)))
+        return row
 
-def parse_input(input_: str) -> tuple[PartNumberLog, SymbolLog]:
-    part_numbers: PartNumberLog = {}
-    symbols: SymbolLog = {}
+    def number_at(self, col: int) -> int:
+        if 0 <= col < len(self.numbers):
+            return self.numbers[col]
 
-    for row_no, line in enumerate(input_.splitlines()):
-        # Find and save all numbers by their occupied positions
+        return NO_NUMBER
 
-        for m in RE_NUMBER.finditer(line.strip()):
-            c_start = m.start(0)
-            c_end = m.end(0)
-            value = int(m.group(0))
 
-            part_no = PartNumber(
-                value,
-                tuple(Coord(row_no, col_no) for col_no in range(c_start, c_end)),
-            )
+EMPTY_ROW = Row([], array("i"), [], [], bytearray())
 
-            for pos in part_no.locs:
-                part_numbers[pos] = part_no
 
-        # Find and save all symbols by their position
-        for m in RE_SYMBOL.finditer(line.strip()):
-            symbol_pos = Coord(row_no, m.start(0))
-            symbols[symbol_pos] = m.group(0)
+def iter_windows(lines: Iterable[str]) -> Iterator[tuple[Row, Row, Row]]:
+    """
+    Yield each row of a schematic along with the rows above and below it.
 
-    return part_numbers, symbols
+    Only three rows are held at once, so memory use is proportional to the
+    width of the schematic rather than its area.
+    """
+    above, row = EMPTY_ROW, None
 
+    for line in lines:
+        below = Row.parse(line)
 
-def part_a_solution(input_: str) -> Optional[int]:
+        if row is not None:
+            yield above, row, below
+            above = row
+
+        row = below
+
+    if row is not None:
+        yield above, row, EMPTY_ROW
+
+
+def part_a_stream(lines: Iterable[str]) -> int:
+    """Compute the Part A solution one row at a time."""
+    total = 0
+
+    for window in iter_windows(lines):
+        for col in window[1].symbols:
+            for row in window:
+                for c in (col - 1, col, col + 1):
+                    number_id = row.number_at(c)
+                    if number_id != NO_NUMBER and not row.counted[number_id]:
+                        row.counted[number_id] = 1
+                        total += row.values[number_id]
+
+    return total
+
+
+def part_b_stream(lines: Iterable[str]) -> int:
+    """Compute the Part B solution one row at a time."""
+    ratio_sum = 0
+
+    for window in iter_windows(lines):
+        for col in window[1].gears:
+            adjacent = {
+                (row_idx, row.number_at(c))
+                for row_idx, row in enumerate(window)
+                for c in (col - 1, col, col + 1)
+                if row.number_at(c) != NO_NUMBER
+            }
+
+            if len(adjacent) != 2:  # noqa: PLR2004
+                continue
+
+            (a_row, a), (b_row, b) = adjacent
+            ratio_sum += window[a_row].values[a] * window[b_row].values[b]
+
+    return ratio_sum
+
+
+def parse(input_: str) -> Schematic:
+    """Parse an input once, so it can be shared by both parts."""
+    return Schematic.parse(input_)
+
+
+def part_a_solution(input_: Union[str, Schematic]) -> Optional[int]:
     """Compute the solution to a Part A input."""
-    assert len(input_) > 0
+    if isinstance(input_, str):
+        assert len(input_) > 0
+        input_ = parse(input_)
 
-    part_numbers, symbols = parse_input(input_)
-    valid_numbers: list[PartNumber] = []
+    schematic = input_
+    numbers = schematic.numbers
+    neighbors = schematic.neighbors
 
-    # For each position next to a symbol
-    for symbol_pos in symbols:
-        for near in symbol_pos.neighbors():
-            # if that position matches a number
-            if near in part_numbers:
-                # Save the number
-                part_no = part_numbers[near]
-                valid_numbers.append(part_no)
+    # Each number is only counted once, even if next to several symbols
+    counted = bytearray(len(schematic.values))
+    total = 0
 
-                # and remove it from the list so we don't add it again
-                for pos in part_no.locs:
-                    del part_numbers[pos]
+    for offset in schematic.symbols:
+        for d in neighbors:
+            number_id = numbers[offset + d]
+            if number_id != NO_NUMBER and not counted[number_id]:
+                counted[number_id] = 1
+                total += schematic.values[number_id]
 
-    return sum(p.value for p in valid_numbers)
+    return total
 
 
-def part_b_solution(input_: str) -> Optional[int]:
+def part_b_solution(input_: Union[str, Schematic]) -> Optional[int]:
     """Compute the solution to a Part B input."""
-    assert len(input_) > 0
+    if isinstance(input_, str):
+        assert len(input_) > 0
+        input_ = parse(input_)
 
-    part_numbers, symbols = parse_input(input_)
+    schematic = input_
     ratio_sum = 0
 
-    # For each gear
-    for s_pos, s in symbols.items():
-        if s != "*":
-            continue
-
-        # Get unique, adjacent, part numbers
-        neighbors = {
-            part_numbers[n_pos] for n_pos in s_pos.neighbors() if n_pos in part_numbers
-        }
+    # For each gear with exactly two adjacent part numbers
+    for offset in schematic.gears:
+        adjacent = schematic.adjacent(offset)
 
-        if len(neighbors) != 2:  # noqa: PLR2004
+        if len(adjacent) != 2:  # noqa: PLR2004
             continue
 
-        a, b = list(neighbors)
+        a, b = adjacent
 
-        ratio = a.value * b.value
+        ratio = schematic.values[a] * schematic.values[b]
         ratio_sum += ratio
 
     return ratio_sum
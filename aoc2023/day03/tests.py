@@ -1,9 +1,20 @@
 """AOC 2023 Day 3 example tests."""
 
+import io
+import re
+from typing import Any, Callable, Iterable
+
 import pytest
 
 from aoc2023.day03.data import PART_A_EXAMPLES, PART_B_EXAMPLES
-from aoc2023.day03.solution import part_a_solution, part_b_solution
+from aoc2023.day03.generate import generate
+from aoc2023.day03.solution import (
+    parse,
+    part_a_solution,
+    part_a_stream,
+    part_b_solution,
+    part_b_stream,
+)
 
 
 @pytest.mark.parametrize(
@@ -28,3 +39,88 @@ def test_example_a(given: str, expected: int) -> None:
 def test_example_b(given: str, expected: int) -> None:
     """Test the part a solution on the given example."""
     assert part_b_solution(given) == expected
+
+
+@pytest.mark.parametrize(
+    ("stream", "given", "expected"),
+    [
+        pytest.param(part_a_stream, example.input, example.solution, id=f"a{seq:02d}")
+        for seq, example in enumerate(PART_A_EXAMPLES)
+    ]
+    + [
+        pytest.param(part_b_stream, example.input, example.solution, id=f"b{seq:02d}")
+        for seq, example in enumerate(PART_B_EXAMPLES)
+    ],
+)
+def test_example_stream(
+    stream: Callable[[Iterable[str]], int],
+    given: str,
+    expected: int,
+) -> None:
+    """Test the streaming solutions on the given example read as a file."""
+    assert stream(io.StringIO(given)) == expected
+
+
+@pytest.mark.parametrize(
+    ("solution", "given", "expected"),
+    [
+        pytest.param(part_a_solution, ex.input, ex.solution, id=f"a{seq:02d}")
+        for seq, ex in enumerate(PART_A_EXAMPLES)
+    ]
+    + [
+        pytest.param(part_b_solution, ex.input, ex.solution, id=f"b{seq:02d}")
+        for seq, ex in enumerate(PART_B_EXAMPLES)
+    ],
+)
+def test_example_parsed(
+    solution: Callable[[Any], int],
+    given: str,
+    expected: int,
+) -> None:
+    """Test the solutions on the given example parsed ahead of time."""
+    assert solution(parse(given)) == expected
+
+
+# A gear is a "*" next to exactly this many part numbers
+GEAR_PARTS = 2
+
+
+def part_numbers_naive(lines: list[str]) -> list[tuple[int, set[tuple[int, int]]]]:
+    """Find each number, and the symbols around it, by checking every neighbour."""
+    numbers: list[tuple[int, set[tuple[int, int]]]] = []
+
+    for row, line in enumerate(lines):
+        for m in re.finditer(r"\d+", line):
+            symbols = {
+                (r, c)
+                for r in range(max(row - 1, 0), min(row + 2, len(lines)))
+                for c in range(max(m.start() - 1, 0), min(m.end() + 1, len(line)))
+                if lines[r][c] != "." and not lines[r][c].isdigit()
+            }
+            numbers.append((int(m.group(0)), symbols))
+
+    return numbers
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_generated(seed: int) -> None:
+    """Test every solution against a naive neighbour search on a generated input."""
+    given = generate(100, seed)
+    lines = given.splitlines()
+    numbers = part_numbers_naive(lines)
+
+    gears: dict[tuple[int, int], list[int]] = {}
+    for number, symbols in numbers:
+        for r, c in symbols:
+            if lines[r][c] == "*":
+                gears.setdefault((r, c), []).append(number)
+
+    expected_a = sum(number for number, symbols in numbers if symbols)
+    expected_b = sum(n[0] * n[1] for n in gears.values() if len(n) == GEAR_PARTS)
+
+    assert part_a_solution(given) == expected_a
+    assert part_a_solution(parse(given)) == expected_a
+    assert part_a_stream(io.StringIO(given)) == expected_a
+    assert part_b_solution(given) == expected_b
+    assert part_b_solution(parse(given)) == expected_b
+    assert part_b_stream(io.StringIO(given)) == expected_b
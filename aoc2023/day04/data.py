@@ -1,6 +1,6 @@
 """AOC 2023 Day 4 example data and input functions."""
 
-from aoc2023.data import Example, get_puzzle_input
+from aoc2023.data import Example, lazy_puzzle_input
 
 # Adding examples to a part's list signals to the system that the part is
 # ready for testing
@@ -31,7 +31,9 @@ Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11
     ),
 ]
 
-PUZZLE_INPUT = get_puzzle_input(4)
+# Loaded from disk on first access
+PUZZLE_INPUT: str
+__getattr__ = lazy_puzzle_input(__name__, 4)
 
 PUZZLE_ANSWER_A: int | None = 26218
 PUZZLE_ANSWER_B: int | None = 9997537
@@ -0,0 +1,34 @@
+"""AOC 2023 Day 4 synthetic input generator."""
+
+import random
+
+NUMBER_MAX = 99
+WINNING_COUNT = 10
+HAVE_COUNT = 25
+
+
+def generate(cards: int, seed: int = 0) -> str:
+    """Generate a valid input with the given number of cards."""
+    rng = random.Random(seed)
+    numbers = range(1, NUMBER_MAX + 1)
+    lines: list[str] = []
+
+    for card_id in range(1, cards + 1):
+        winning = rng.sample(numbers, WINNING_COUNT)
+        others = [n for n in numbers if n not in winning]
+
+        # Matches are kept rare, as in real inputs, or the number of copies
+        # grows exponentially with the number of cards. Cards never win copies
+        # of cards past the end of the table.
+        matches = min(int(rng.expovariate(1.0)), WINNING_COUNT, cards - card_id)
+
+        have = rng.sample(winning, matches) + rng.sample(others, HAVE_COUNT - matches)
+        rng.shuffle(have)
+
+        lines.append(
+            f"Card {card_id:3d}: "
+            f"{' '.join(f'{n:2d}' for n in winning)} | "
+            f"{' '.join(f'{n:2d}' for n in have)}",
+        )
+
+    return "\n".join(lines)
@@ -1,6 +1,21 @@
 """AOC 2023 Day 4 solutions."""
 
-from typing import NamedTuple, Optional
+from array import array
+from functools import reduce
+from operator import or_
+from typing import Iterable, NamedTuple, Optional, Union
+
+Line = Union[str, bytes, bytearray, memoryview]
+
+
+class NumberBits(dict[bytes, int]):
+    """Map the text of a number to its bit; precomputed for numbers below 100."""
+
+    def __missing__(self, key: bytes) -> int:
+        return 1 << int(key)
+
+
+NUMBER_BITS = NumberBits({str(n).encode(): 1 << n for n in range(100)})
 
 
 class Card(NamedTuple):
@@ -27,33 +42,136 @@ class Card(NamedTuple):
 
     @property
     def winning_score(self) -> int:
-        count = len(self.winning_numbers)
-        if count <= 0:
-            return 0
+        return score(len(self.winning_numbers))
 
-        return 2 ** (count - 1)
 
+def score(count: int) -> int:
+    if count <= 0:
+        return 0
 
-def part_a_solution(input_: str) -> Optional[int]:
-    """Compute the solution to a Part A input."""
-    assert len(input_) > 0
+    return 2 ** (count - 1)
 
-    return sum(Card.parse(line).winning_score for line in input_.splitlines())
 
+def as_bytes(line: Line) -> bytes:
+    """
+    Return a line as bytes, to split into numbers.
 
-def part_b_solution(input_: str) -> Optional[int]:
-    """Compute the solution to a Part B input."""
-    assert len(input_) > 0
+    Views, such as the lines of a memory-mapped input, are copied; only one
+    line is held at a time, but the input is not read without copying.
+    """
+    if isinstance(line, bytes):
+        return line
+    if isinstance(line, str):
+        return line.encode("ascii")
+
+    return bytes(line)
+
+
+def number_mask(numbers: bytes) -> int:
+    """Combine a list of numbers into a bitmask with one bit per number."""
+    return reduce(or_, map(NUMBER_BITS.__getitem__, numbers.split()), 0)
+
+
+def match_count(line: Line) -> int:
+    """
+    Count a card's winning numbers directly from its text.
+
+    Both lists of numbers are reduced to bitmasks, so the count is the popcount
+    of their intersection; no Card or sets are built.
+    """
+    data = as_bytes(line)
+
+    start = data.index(b":") + 1
+    bar = data.index(b"|", start)
+
+    winning = number_mask(data[start:bar])
+    present = number_mask(data[bar + 1 :])
+
+    return (winning & present).bit_count()
+
+
+def part_a_stream(lines: Iterable[Line]) -> int:
+    """Compute the Part A solution one line at a time."""
+    total = 0
+    for line in lines:
+        data = as_bytes(line)
+        if len(data.strip()) <= 0:
+            continue
+
+        total += score(match_count(data))
 
-    cards = [Card.parse(line) for line in input_.splitlines()]
-    count = [1 for _ in cards]
+    return total
 
-    for idx, card in enumerate(cards):
-        new_cards = len(card.winning_numbers)
-        copies = count[idx]
 
-        for copy in range(idx + 1, idx + new_cards + 1):
-            if copy < len(cards):
-                count[copy] += copies
+def resize_ring(ring: list[int], idx: int, size: int) -> list[int]:
+    """Copy the entries of a ring buffer for cards after `idx` into a larger one."""
+    resized = [0] * size
+
+    for card in range(idx + 1, idx + len(ring) + 1):
+        resized[card % size] = ring[card % len(ring)]
+
+    return resized
+
+
+def part_b_stream(lines: Iterable[Line]) -> int:
+    """Compute the Part B solution one line at a time."""
+    return count_copies(
+        match_count(data) for data in map(as_bytes, lines) if len(data.strip()) > 0
+    )
+
+
+def count_copies(match_counts: Iterable[int]) -> int:
+    """Count the cards held in total, given each card's number of matches."""
+    # A difference array of the extra copies of upcoming cards, stored in a
+    # ring buffer indexed by card number. Winning copies of the next `n` cards
+    # adds to the first and subtracts after the last, so each card is O(1).
+    pending = [0]
+    extra = 0
+    total = 0
+
+    for idx, new_cards in enumerate(match_counts):
+        slot = idx % len(pending)
+        extra += pending[slot]
+        pending[slot] = 0
+
+        copies = 1 + extra
+        total += copies
+
+        if new_cards > 0:
+            if new_cards + 1 > len(pending):
+                pending = resize_ring(pending, idx, new_cards + 1)
+
+            pending[(idx + 1) % len(pending)] += copies
+            pending[(idx + new_cards + 1) % len(pending)] -= copies
+
+    return total
+
+
+def parse(input_: str) -> array:
+    """Parse an input once into each card's number of matches, for both parts."""
+    return array(
+        "I",
+        (
+            match_count(line)
+            for line in input_.encode("ascii").splitlines()
+            if len(line.strip()) > 0
+        ),
+    )
+
+
+def part_a_solution(input_: Union[str, array]) -> Optional[int]:
+    """Compute the solution to a Part A input."""
+    if isinstance(input_, str):
+        assert len(input_) > 0
+        input_ = parse(input_)
+
+    return sum(score(count) for count in input_)
+
+
+def part_b_solution(input_: Union[str, array]) -> Optional[int]:
+    """Compute the solution to a Part B input."""
+    if isinstance(input_, str):
+        assert len(input_) > 0
+        input_ = parse(input_)
 
-    return sum(count)
+    return count_copies(input_)
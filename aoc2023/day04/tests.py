@@ -1,9 +1,23 @@
 """AOC 2023 Day 4 example tests."""
 
+import io
+import random
+from typing import Any, Callable, Iterable
+
 import pytest
 
 from aoc2023.day04.data import PART_A_EXAMPLES, PART_B_EXAMPLES
-from aoc2023.day04.solution import part_a_solution, part_b_solution
+from aoc2023.day04.generate import generate
+from aoc2023.day04.solution import (
+    Card,
+    count_copies,
+    match_count,
+    parse,
+    part_a_solution,
+    part_a_stream,
+    part_b_solution,
+    part_b_stream,
+)
 
 
 @pytest.mark.parametrize(
@@ -28,3 +42,103 @@ def test_example_a(given: str, expected: int) -> None:
 def test_example_b(given: str, expected: int) -> None:
     """Test the part a solution on the given example."""
     assert part_b_solution(given) == expected
+
+
+@pytest.mark.parametrize(
+    ("stream", "given", "expected"),
+    [
+        pytest.param(part_a_stream, example.input, example.solution, id=f"a{seq:02d}")
+        for seq, example in enumerate(PART_A_EXAMPLES)
+    ]
+    + [
+        pytest.param(part_b_stream, example.input, example.solution, id=f"b{seq:02d}")
+        for seq, example in enumerate(PART_B_EXAMPLES)
+    ],
+)
+def test_example_stream(
+    stream: Callable[[Iterable[str]], int],
+    given: str,
+    expected: int,
+) -> None:
+    """Test the streaming solutions on the given example read as a file."""
+    assert stream(io.StringIO(given)) == expected
+
+
+@pytest.mark.parametrize(
+    "given",
+    [
+        pytest.param(line, id=f"{seq:02d}")
+        for seq, line in enumerate(PART_A_EXAMPLES[0].input.splitlines())
+    ],
+)
+def test_match_count(given: str) -> None:
+    """Test the bitmask match count against the set-based Card."""
+    expected = len(Card.parse(given).winning_numbers)
+
+    assert match_count(given) == expected
+    assert match_count(memoryview(given.encode("ascii"))) == expected
+
+
+@pytest.mark.parametrize(
+    ("solution", "given", "expected"),
+    [
+        pytest.param(part_a_solution, ex.input, ex.solution, id=f"a{seq:02d}")
+        for seq, ex in enumerate(PART_A_EXAMPLES)
+    ]
+    + [
+        pytest.param(part_b_solution, ex.input, ex.solution, id=f"b{seq:02d}")
+        for seq, ex in enumerate(PART_B_EXAMPLES)
+    ],
+)
+def test_example_parsed(
+    solution: Callable[[Any], int],
+    given: str,
+    expected: int,
+) -> None:
+    """Test the solutions on the given example parsed ahead of time."""
+    assert solution(parse(given)) == expected
+
+
+# How often a card in test_count_copies wins many copies, forcing the ring
+# buffer to resize while earlier copies are still pending
+LARGE_MATCH_RATE = 0.05
+
+
+def count_copies_nested(match_counts: list[int]) -> int:
+    """Count copies the simple way, adding each card's copies to the cards it wins."""
+    copies = [1] * len(match_counts)
+
+    for idx, new_cards in enumerate(match_counts):
+        for won in range(idx + 1, min(idx + new_cards + 1, len(copies))):
+            copies[won] += copies[idx]
+
+    return sum(copies)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_count_copies(seed: int) -> None:
+    """Test the ring buffer against nested loops, with match counts that grow it."""
+    rng = random.Random(seed)
+    match_counts = [
+        rng.randint(20, 60) if rng.random() < LARGE_MATCH_RATE else rng.randint(0, 3)
+        for _ in range(500)
+    ]
+
+    assert count_copies(match_counts) == count_copies_nested(match_counts)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_generated(seed: int) -> None:
+    """Test every solution against the Card class on a generated input."""
+    given = generate(200, seed)
+    cards = [Card.parse(line) for line in given.splitlines()]
+
+    expected_a = sum(card.winning_score for card in cards)
+    expected_b = count_copies_nested([len(card.winning_numbers) for card in cards])
+
+    assert part_a_solution(given) == expected_a
+    assert part_a_solution(parse(given)) == expected_a
+    assert part_a_stream(io.StringIO(given)) == expected_a
+    assert part_b_solution(given) == expected_b
+    assert part_b_solution(parse(given)) == expected_b
+    assert part_b_stream(io.StringIO(given)) == expected_b
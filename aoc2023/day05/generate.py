@@ -0,0 +1,64 @@
+"""AOC 2023 Day 5 synthetic input generator."""
+
+import random
+from itertools import pairwise
+from typing import Optional
+
+CATEGORIES = (
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+)
+
+VALUE_SPACE = 2**32
+# The seed ranges of Part B cover at most this fraction of the value space
+SEED_COVERAGE = 0.25
+
+
+def generate(ranges: int, seed: int = 0, seeds: Optional[int] = None) -> str:
+    """
+    Generate a valid almanac with the given number of ranges per map.
+
+    `seeds` is the number of values on the seeds line, which defaults to
+    `ranges`. It is rounded up to an even number, since Part B reads the
+    values in pairs.
+    """
+    rng = random.Random(seed)
+    seeds = ranges if seeds is None else seeds
+
+    pairs = (seeds + 1) // 2
+    span_max = max(int(VALUE_SPACE * SEED_COVERAGE / max(pairs, 1)), 1)
+
+    seed_values: list[int] = []
+    for _ in range(pairs):
+        start = rng.randrange(VALUE_SPACE)
+        seed_values += [start, rng.randint(1, min(VALUE_SPACE - start, span_max))]
+
+    blocks = [f"seeds: {' '.join(map(str, seed_values))}"]
+
+    for src, dst in pairwise(CATEGORIES):
+        # Each map shuffles a partition of the value space, like real inputs
+        cuts = sorted(rng.sample(range(1, VALUE_SPACE), max(ranges - 1, 0)))
+        bounds = list(pairwise([0, *cuts, VALUE_SPACE]))
+        dst_order = rng.sample(bounds, len(bounds))
+
+        dst_starts: list[int] = []
+        dst_start = 0
+        for start, end in dst_order:
+            dst_starts.append(dst_start)
+            dst_start += end - start
+
+        lines = [
+            f"{d} {start} {end - start}"
+            for d, (start, end) in zip(dst_starts, dst_order, strict=True)
+        ]
+        rng.shuffle(lines)
+
+        blocks.append("\n".join([f"{src}-to-{dst} map:", *lines]))
+
+    return "\n\n".join(blocks)
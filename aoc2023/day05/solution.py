@@ -1,9 +1,18 @@
 """AOC 2023 Day 5 solutions."""
 
-import logging
+import importlib.util
 import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import NamedTuple, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, NamedTuple, Optional, Union
+
+# NumPy is optional and slow to import, so only the vectorized path imports it;
+# without it, Part A falls back to pure Python
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 RE_MAP_START = re.compile(r"(?P<src>[a-z]+)-to-(?P<dst>[a-z]+) map:")
 
@@ -16,6 +25,10 @@ class Range(NamedTuple):
     def contains(self, value: int) -> bool:
         return value >= self.src_start and value < self.src_start + self.size
 
+    @property
+    def src_end(self) -> int:
+        return self.src_start + self.size
+
     def convert(self, value: int) -> int:
         return value - self.src_start + self.dst_start
 
@@ -25,19 +38,168 @@ class Item(NamedTuple):
     value: int
 
 
+class Span(NamedTuple):
+    """A half-open interval of values, `[start, start + size)`."""
+
+    start: int
+    size: int
+
+    @property
+    def end(self) -> int:
+        return self.start + self.size
+
+
+class SpanItem(NamedTuple):
+    name: str
+    spans: list[Span]
+
+
+def merge_spans(spans: Iterable[Span]) -> list[Span]:
+    """Sort spans and coalesce any that overlap or touch."""
+    merged: list[Span] = []
+
+    for span in sorted(spans):
+        if span.size <= 0:
+            continue
+
+        if merged and span.start <= merged[-1].end:
+            last = merged[-1]
+            merged[-1] = Span(last.start, max(last.end, span.end) - last.start)
+        else:
+            merged.append(span)
+
+    return merged
+
+
 @dataclass
 class Map:
     dst: str
     ranges: list[Range] = field(default_factory=list)
+    starts: list[int] = field(default_factory=list, repr=False, compare=False)
+
+    def sort(self) -> None:
+        """Sort the ranges and rebuild the index used for binary searches."""
+        self.ranges.sort()
+        self.starts = [r.src_start for r in self.ranges]
+
+    def find(self, value: int) -> int:
+        """Return the index of the last Range starting at or before `value`."""
+        if len(self.starts) != len(self.ranges):
+            self.sort()
+
+        return bisect_right(self.starts, value) - 1
 
     def convert(self, value: int) -> Item:
-        for r in self.ranges:
-            if r.contains(value):
+        idx = self.find(value)
+        if idx >= 0:
+            r = self.ranges[idx]
+            if value < r.src_end:
                 return Item(self.dst, r.convert(value))
 
         # If no range is found
         return Item(self.dst, value)
 
+    def convert_spans(self, spans: Iterable[Span]) -> SpanItem:
+        """Convert whole spans, splitting them at the boundaries of each Range."""
+        converted: list[Span] = []
+
+        for span in spans:
+            start, end = span.start, span.end
+
+            # Indexed, so that the ranges before the first overlap aren't visited
+            for idx in range(max(self.find(start), 0), len(self.ranges)):
+                r = self.ranges[idx]
+                if r.src_end <= start:
+                    continue
+                if r.src_start >= end:
+                    break
+
+                # Values below this range are passed through unchanged
+                if r.src_start > start:
+                    converted.append(Span(start, r.src_start - start))
+                    start = r.src_start
+
+                overlap_end = min(end, r.src_end)
+                converted.append(Span(r.convert(start), overlap_end - start))
+                start = overlap_end
+
+                if start >= end:
+                    break
+
+            if start < end:
+                converted.append(Span(start, end - start))
+
+        return SpanItem(self.dst, converted)
+
+    def convert_array(self, values: "NDArray[np.int64]") -> "NDArray[np.int64]":
+        """Convert an entire array of values at once using NumPy."""
+        import numpy as np
+
+        if len(self.starts) != len(self.ranges):
+            self.sort()
+
+        if not self.ranges:
+            return values
+
+        starts = np.array(self.starts, dtype=np.int64)
+        ends = np.array([r.src_end for r in self.ranges], dtype=np.int64)
+        offsets = np.array(
+            [r.dst_start - r.src_start for r in self.ranges],
+            dtype=np.int64,
+        )
+
+        idx = np.searchsorted(starts, values, side="right") - 1
+        found = np.maximum(idx, 0)
+        hit = (idx >= 0) & (values < ends[found])
+
+        return values + np.where(hit, offsets[found], 0)
+
+    def segments(self, bound: int) -> Iterator[Range]:
+        """Cover `[0, bound)` with the ranges plus identity ranges for the gaps."""
+        if len(self.starts) != len(self.ranges):
+            self.sort()
+
+        pos = 0
+        for r in self.ranges:
+            if r.src_start > pos:
+                yield Range(pos, pos, r.src_start - pos)
+            yield r
+            pos = r.src_end
+
+        if pos < bound:
+            yield Range(pos, pos, bound - pos)
+
+    def compose(self, other: "Map") -> "Map":
+        """Collapse this Map and the one following it into a single Map."""
+        # Beyond every range of both maps, both (and so the result) are identity
+        bound = max((r.src_end for r in (*self.ranges, *other.ranges)), default=0)
+        ranges: list[Range] = []
+
+        for seg in self.segments(bound):
+            src = seg.src_start
+
+            for piece in other.convert_spans([Span(seg.dst_start, seg.size)]).spans:
+                prev = ranges[-1] if ranges else None
+
+                if (
+                    prev is not None
+                    and prev.src_end == src
+                    and prev.dst_start + prev.size == piece.start
+                ):
+                    ranges[-1] = Range(
+                        prev.src_start,
+                        prev.dst_start,
+                        prev.size + piece.size,
+                    )
+                elif piece.start != src:
+                    ranges.append(Range(src, piece.start, piece.size))
+
+                src += piece.size
+
+        composed = Map(other.dst, ranges)
+        composed.sort()
+        return composed
+
 
 @dataclass
 class Data:
@@ -45,16 +207,55 @@ class Data:
     maps: dict[str, Map] = field(default_factory=dict)
 
     def convert(self, item: Item) -> Item:
-        logger = logging.getLogger(__name__)
+        if item.name not in self.maps:
+            raise ValueError(f"No {item.name} Map found")
+
+        return self.maps[item.name].convert(item.value)
 
+    def convert_spans(self, item: SpanItem) -> SpanItem:
         if item.name not in self.maps:
             raise ValueError(f"No {item.name} Map found")
 
-        mapped = self.maps[item.name].convert(item.value)
+        mapped = self.maps[item.name].convert_spans(item.spans)
+
+        return SpanItem(mapped.name, merge_spans(mapped.spans))
+
+    def locate_spans(self, spans: Iterable[Span]) -> list[Span]:
+        """Push source spans through every Map until they become locations."""
+        item = SpanItem(self.sources[0].name, merge_spans(spans))
+
+        while item.name != "location":
+            item = self.convert_spans(item)
+
+        return item.spans
 
-        logger.debug(f"{item} -> {mapped}")
+    def locate_array(self, values: "NDArray[np.int64]") -> "NDArray[np.int64]":
+        """Push an array of source values through every Map using NumPy."""
+        name = self.sources[0].name
 
-        return mapped
+        while name != "location":
+            if name not in self.maps:
+                raise ValueError(f"No {name} Map found")
+
+            m = self.maps[name]
+            values = m.convert_array(values)
+            name = m.dst
+
+        return values
+
+    def compose(self, name: str = "seed", target: str = "location") -> Map:
+        """Collapse the chain of Maps from `name` to `target` into one Map."""
+        if name not in self.maps:
+            raise ValueError(f"No {name} Map found")
+
+        composed = self.maps[name]
+        while composed.dst != target:
+            if composed.dst not in self.maps:
+                raise ValueError(f"No {composed.dst} Map found")
+
+            composed = composed.compose(self.maps[composed.dst])
+
+        return composed
 
     @classmethod
     def parse(cls, input_: str) -> "Data":
@@ -88,27 +289,51 @@ class Data:
                     Range(int(src), int(dst), int(size)),
                 )
 
+        for map_ in data.maps.values():
+            map_.sort()
+
         return data
 
 
-def part_a_solution(input_: str) -> Optional[int]:
+def parse(input_: str) -> Data:
+    """Parse an input once, so it can be shared by both parts."""
+    return Data.parse(input_)
+
+
+def part_a_solution(input_: Union[str, Data]) -> Optional[int]:
     """Compute the solution to a Part A input."""
-    assert len(input_) > 0
+    if isinstance(input_, str):
+        assert len(input_) > 0
+        input_ = parse(input_)
 
-    d = Data.parse(input_)
+    d = input_
 
-    locations: list[int] = []
+    if HAVE_NUMPY:
+        import numpy as np
 
-    for i in d.sources:
-        item = i
-        while item.name != "location":
-            item = d.convert(item)
-        locations.append(item.value)
+        seeds = np.array([i.value for i in d.sources], dtype=np.int64)
+        return int(d.locate_array(seeds).min())
 
-    return min(locations)
+    # Each seed is a span of one; duplicates and neighbors are merged so they
+    # are only converted once
+    locations = d.locate_spans(Span(i.value, 1) for i in d.sources)
 
+    return locations[0].start
 
-def part_b_solution(input_: str) -> Optional[int]:
+
+def part_b_solution(input_: Union[str, Data]) -> Optional[int]:
     """Compute the solution to a Part B input."""
-    assert len(input_) > 0
-    return None
+    if isinstance(input_, str):
+        assert len(input_) > 0
+        input_ = parse(input_)
+
+    d = input_
+
+    values = [i.value for i in d.sources]
+    seeds = [
+        Span(start, size) for start, size in zip(values[::2], values[1::2], strict=True)
+    ]
+
+    locations = d.locate_spans(seeds)
+
+    return locations[0].start
@@ -1,9 +1,21 @@
 """AOC 2023 Day 5 example tests."""
 
+from typing import Any, Callable, Iterator, SupportsIndex, Union, overload
+
 import pytest
 
 from aoc2023.day05.data import PART_A_EXAMPLES, PART_B_EXAMPLES
-from aoc2023.day05.solution import part_a_solution, part_b_solution
+from aoc2023.day05.generate import generate
+from aoc2023.day05.solution import (
+    Data,
+    Item,
+    Map,
+    Range,
+    Span,
+    parse,
+    part_a_solution,
+    part_b_solution,
+)
 
 
 @pytest.mark.parametrize(
@@ -28,3 +40,134 @@ def test_example_a(given: str, expected: int) -> None:
 def test_example_b(given: str, expected: int) -> None:
     """Test the part a solution on the given example."""
     assert part_b_solution(given) == expected
+
+
+@pytest.mark.parametrize(
+    "given",
+    [
+        pytest.param(example.input, id=f"{seq:02d}")
+        for seq, example in enumerate(PART_A_EXAMPLES)
+    ],
+)
+def test_composed_map(given: str) -> None:
+    """Test the composed Map against converting through every Map in turn."""
+    data = Data.parse(given)
+    composed = data.compose()
+
+    for value in range(200):
+        item = Item("seed", value)
+        while item.name != "location":
+            item = data.convert(item)
+
+        assert composed.convert(value) == item
+
+
+class CountedRanges(list[Range]):
+    """A list of Ranges that counts how many are read."""
+
+    visited = 0
+
+    @overload
+    def __getitem__(self, idx: SupportsIndex) -> Range: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[Range]: ...
+
+    def __getitem__(
+        self,
+        idx: Union[SupportsIndex, slice],
+    ) -> Union[Range, list[Range]]:
+        item = super().__getitem__(idx)
+        self.visited += len(item) if isinstance(item, list) else 1
+        return item
+
+    def __iter__(self) -> Iterator[Range]:
+        for r in super().__iter__():
+            self.visited += 1
+            yield r
+
+
+def test_convert_spans_visits() -> None:
+    """Test that converting a span only visits the ranges around it."""
+    count = 20_000
+    map_ = Map("soil", [Range(idx * 10, idx * 10 + 5, 10) for idx in range(count)])
+    map_.sort()
+    ranges = map_.ranges = CountedRanges(map_.ranges)
+
+    converted = map_.convert_spans([Span((count - 2) * 10 + 3, 10)])
+
+    assert converted.spans == [
+        Span((count - 2) * 10 + 8, 7),
+        Span((count - 1) * 10 + 5, 3),
+    ]
+    # The bisection finds the first range; a linear skip would visit them all
+    assert ranges.visited <= 3  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    "given",
+    [
+        pytest.param(example.input, id=f"{seq:02d}")
+        for seq, example in enumerate(PART_A_EXAMPLES)
+    ],
+)
+def test_locate_array(given: str) -> None:
+    """Test the NumPy conversion against converting one value at a time."""
+    np = pytest.importorskip("numpy")
+
+    data = Data.parse(given)
+    values = list(range(200))
+
+    located = data.locate_array(np.array(values, dtype=np.int64))
+
+    for value, location in zip(values, located, strict=True):
+        item = Item("seed", value)
+        while item.name != "location":
+            item = data.convert(item)
+
+        assert int(location) == item.value
+
+
+@pytest.mark.parametrize(
+    ("solution", "given", "expected"),
+    [
+        pytest.param(part_a_solution, ex.input, ex.solution, id=f"a{seq:02d}")
+        for seq, ex in enumerate(PART_A_EXAMPLES)
+    ]
+    + [
+        pytest.param(part_b_solution, ex.input, ex.solution, id=f"b{seq:02d}")
+        for seq, ex in enumerate(PART_B_EXAMPLES)
+    ],
+)
+def test_example_parsed(
+    solution: Callable[[Any], int],
+    given: str,
+    expected: int,
+) -> None:
+    """Test the solutions on the given example parsed ahead of time."""
+    assert solution(parse(given)) == expected
+
+
+@pytest.mark.parametrize("have_numpy", [True, False], ids=["numpy", "python"])
+@pytest.mark.parametrize("seed", range(3))
+def test_generated_a(
+    seed: int,
+    have_numpy: bool,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test Part A on a generated input against converting each seed in turn."""
+    if have_numpy:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr("aoc2023.day05.solution.HAVE_NUMPY", have_numpy)
+
+    given = generate(50, seed)
+    data = Data.parse(given)
+
+    locations = []
+    for source in data.sources:
+        item = source
+        while item.name != "location":
+            item = data.convert(item)
+        locations.append(item.value)
+
+    assert part_a_solution(given) == min(locations)
@@ -0,0 +1,241 @@
+"""Fetch puzzle inputs concurrently into a content-addressed local store."""
+
+import hashlib
+import logging
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional, Protocol
+
+from aoc2023.cache import get_cache_dir
+
+AOC_BASE_URL = "https://adventofcode.com"
+USER_AGENT = "github.com/therealzanfar/aoc2023"
+STORE_DIRNAME = "inputs"
+
+FETCH_WORKERS = 4
+FETCH_RETRIES = 3
+FETCH_MIN_INTERVAL = 1.0
+FETCH_BACKOFF = 2.0
+FETCH_TIMEOUT = 30.0
+
+# HTTP statuses worth retrying; anything else won't change on a second try
+RETRY_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+
+
+class FetchError(Exception):
+    """A puzzle input could not be fetched."""
+
+    def __init__(self, message: str, retryable: bool = False) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class Fetcher(Protocol):
+    """Anything that can fetch a single day's puzzle input."""
+
+    def fetch(self, year: int, day: int) -> str: ...
+
+
+class HttpFetcher:
+    """Fetch inputs over HTTP, from the AoC website or a stand-in for it."""
+
+    def __init__(
+        self,
+        session: Optional[str] = None,
+        base_url: str = AOC_BASE_URL,
+        timeout: float = FETCH_TIMEOUT,
+    ) -> None:
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def fetch(self, year: int, day: int) -> str:
+        request = urllib.request.Request(
+            f"{self.base_url}/{year}/day/{day}/input",
+            headers={"User-Agent": USER_AGENT},
+        )
+        if self.session is not None:
+            request.add_header("Cookie", f"session={self.session}")
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read().decode("utf-8")
+
+        except urllib.error.HTTPError as e:
+            raise FetchError(
+                f"HTTP {e.code} fetching day {day}",
+                retryable=e.code in RETRY_STATUSES,
+            ) from e
+
+        except (urllib.error.URLError, TimeoutError) as e:
+            raise FetchError(f"Could not fetch day {day}: {e}", retryable=True) from e
+
+
+class RateLimiter:
+    """Space out calls across threads by at least `min_interval` seconds."""
+
+    def __init__(self, min_interval: float = FETCH_MIN_INTERVAL) -> None:
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.min_interval
+
+        if start > now:
+            time.sleep(start - now)
+
+
+class InputStore:
+    """
+    Puzzle inputs stored by the hash of their contents.
+
+    Each input is saved once under `objects/`, and `refs/` records which input
+    belongs to which day.
+    """
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = root or get_cache_dir() / STORE_DIRNAME
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest[2:]
+
+    def _ref_path(self, year: int, day: int) -> Path:
+        return self.root / "refs" / str(year) / f"{day:02d}"
+
+    def put(self, year: int, day: int, data: str) -> str:
+        """Save a day's input, returning its hash."""
+        encoded = data.encode("utf-8")
+        digest = hashlib.sha256(encoded).hexdigest()
+
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            _write_atomic(object_path, encoded)
+
+        _write_atomic(self._ref_path(year, day), digest.encode("ascii"))
+        return digest
+
+    def digest(self, year: int, day: int) -> Optional[str]:
+        """Return the hash of a day's stored input, if there is one."""
+        try:
+            digest = self._ref_path(year, day).read_text(encoding="ascii").strip()
+        except FileNotFoundError:
+            return None
+
+        return digest if self._object_path(digest).exists() else None
+
+    def get(self, year: int, day: int) -> Optional[str]:
+        """Return a day's stored input, if there is one."""
+        digest = self.digest(year, day)
+        if digest is None:
+            return None
+
+        return self._object_path(digest).read_text(encoding="utf-8")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so that readers never see it half-written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+class FetchResult(NamedTuple):
+    """The outcome of fetching one day's input."""
+
+    day: int
+    digest: Optional[str]
+    skipped: bool = False
+    error: Optional[str] = None
+
+
+class FetchOptions(NamedTuple):
+    """
+    How to fetch many days' inputs.
+
+    Transient failures are retried `retries` times, waiting `backoff` seconds
+    before the first retry and twice as long before each one after.
+    """
+
+    workers: int = FETCH_WORKERS
+    force: bool = False
+    retries: int = FETCH_RETRIES
+    min_interval: float = FETCH_MIN_INTERVAL
+    backoff: float = FETCH_BACKOFF
+
+
+def fetch_with_retry(
+    fetcher: Fetcher,
+    year: int,
+    day: int,
+    limiter: RateLimiter,
+    options: Optional[FetchOptions] = None,
+) -> str:
+    """Fetch a day's input, retrying transient failures with exponential backoff."""
+    logger = logging.getLogger(__name__)
+    options = options or FetchOptions()
+
+    for attempt in range(options.retries + 1):
+        limiter.wait()
+
+        try:
+            return fetcher.fetch(year, day)
+
+        except FetchError as e:
+            if not e.retryable or attempt == options.retries:
+                raise
+
+            delay = options.backoff * 2**attempt
+            logger.info("%s; retrying in %.1fs", e, delay)
+            time.sleep(delay)
+
+    raise AssertionError("unreachable")
+
+
+def fetch_days(
+    fetcher: Fetcher,
+    year: int,
+    days: Iterable[int],
+    store: InputStore,
+    options: Optional[FetchOptions] = None,
+) -> list[FetchResult]:
+    """
+    Fetch many days' inputs into the store, a few at a time.
+
+    Args:
+        fetcher (Fetcher): Fetches a single day's input.
+        year (int): The event year.
+        days (Iterable[int]): The days to fetch.
+        store (InputStore): Where to save the inputs.
+        options (FetchOptions, optional): How many fetches to run at once,
+            whether to fetch days that are already stored, and how to retry
+            and space out requests. Defaults to FetchOptions().
+    """
+    logger = logging.getLogger(__name__)
+    options = options or FetchOptions()
+    limiter = RateLimiter(options.min_interval)
+
+    def fetch_one(day: int) -> FetchResult:
+        digest = store.digest(year, day)
+        if digest is not None and not options.force:
+            logger.debug("Day %s is already stored; skipping", day)
+            return FetchResult(day, digest, skipped=True)
+
+        try:
+            data = fetch_with_retry(fetcher, year, day, limiter, options)
+        except FetchError as e:
+            logger.warning("Could not fetch day %s: %s", day, e)
+            return FetchResult(day, None, error=str(e))
+
+        return FetchResult(day, store.put(year, day, data))
+
+    with ThreadPoolExecutor(max_workers=max(options.workers, 1)) as pool:
+        return list(pool.map(fetch_one, days))
@@ -0,0 +1,71 @@
+"""Profile puzzle solutions with cProfile and tracemalloc."""
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional, TypeVar
+
+PROFILE_TOP_FUNCTIONS = 15
+
+T = TypeVar("T")
+
+
+class ProfileOptions(NamedTuple):
+    """Which profilers to wrap a solution in."""
+
+    cpu: bool = False
+    memory: bool = False
+    # If set, cProfile stats are also saved here as `.prof` files
+    dump_dir: Optional[Path] = None
+    top: int = PROFILE_TOP_FUNCTIONS
+
+    @property
+    def enabled(self) -> bool:
+        return self.cpu or self.memory
+
+
+class ProfileReport(NamedTuple):
+    """The results of profiling a single call."""
+
+    hot_functions: Optional[str] = None
+    peak_memory: Optional[int] = None
+    dump_path: Optional[str] = None
+
+
+def profile_call(
+    fn: Callable[[], T],
+    options: ProfileOptions,
+    name: str = "solution",
+) -> tuple[T, ProfileReport]:
+    """Call a function under the selected profilers, returning its result too."""
+    profiler = cProfile.Profile() if options.cpu else None
+
+    if options.memory:
+        tracemalloc.start()
+
+    try:
+        result = profiler.runcall(fn) if profiler is not None else fn()
+
+        peak_memory = tracemalloc.get_traced_memory()[1] if options.memory else None
+
+    finally:
+        if options.memory:
+            tracemalloc.stop()
+
+    hot_functions = None
+    dump_path = None
+
+    if profiler is not None:
+        out = io.StringIO()
+        stats = pstats.Stats(profiler, stream=out)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(options.top)
+        hot_functions = out.getvalue()
+
+        if options.dump_dir is not None:
+            options.dump_dir.mkdir(parents=True, exist_ok=True)
+            dump_path = str(options.dump_dir / f"{name}.prof")
+            stats.dump_stats(dump_path)
+
+    return result, ProfileReport(hot_functions, peak_memory, dump_path)
@@ -0,0 +1,255 @@
+"""Run puzzle solutions, serially or across a process pool."""
+
+import logging
+import time
+from functools import cache, partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+)
+
+from aoc2023.data import get_puzzle_inputs, get_puzzle_parser, get_puzzle_solution
+
+if TYPE_CHECKING:
+    from aoc2023.cache import AnswerCache
+    from aoc2023.profiling import ProfileOptions, ProfileReport
+
+
+class Job(NamedTuple):
+    """A single solution to compute."""
+
+    day: int
+    part: str
+    test: bool
+    seq: int
+
+
+class Result(NamedTuple):
+    """The computed answer for a Job."""
+
+    day: int
+    part: str
+    test: bool
+    seq: int
+    answer: int
+    expected: Optional[int]
+    elapsed_ns: int = 0
+    profile: Optional["ProfileReport"] = None
+    # Cached answers weren't computed, so elapsed_ns is only the lookup time
+    cached: bool = False
+
+    @property
+    def correct(self) -> Optional[bool]:
+        """Whether the answer is correct, or None if it isn't known."""
+        if self.expected is None:
+            return None
+
+        return self.answer == self.expected
+
+    def as_dict(self) -> dict[str, Any]:
+        record = {**self._asdict(), "correct": self.correct}
+        del record["profile"]
+
+        # Flattened so that every format can hold it
+        if self.profile is not None:
+            record["peak_memory"] = self.profile.peak_memory
+            record["profile_path"] = self.profile.dump_path
+
+        return record
+
+
+def list_jobs(
+    days: Iterable[int],
+    parts: Iterable[str],
+    test: bool = False,
+) -> list[Job]:
+    """List every Job for the selected days and parts, in report order."""
+    jobs: list[Job] = []
+
+    for day in days:
+        for part in parts:
+            # Only count the examples; the puzzle input is loaded by the worker
+            count = len(get_puzzle_inputs(day, part, test)) if test else 1
+            jobs.extend(Job(day, part, test, idx) for idx in range(count))
+
+    return jobs
+
+
+# The most recently parsed input of each day, with the result of parsing it
+_parsed: dict[int, tuple[str, Any]] = {}
+
+
+def parse_once(day: int, input_: str) -> object:
+    """
+    Parse an input with the day's `parse` hook, reusing the last result.
+
+    Days without a hook get the input unchanged. Parts A and B of the same
+    input, run in the same process, share a single parse.
+    """
+    parser = get_puzzle_parser(day)
+    if parser is None:
+        return input_
+
+    if day in _parsed:
+        last_input, last_parsed = _parsed[day]
+        if last_input is input_ or last_input == input_:
+            return last_parsed
+
+    parsed = parser(input_)
+    _parsed[day] = (input_, parsed)
+    return parsed
+
+
+def solve(
+    job: Job,
+    cache: bool = False,
+    profile: Optional["ProfileOptions"] = None,
+) -> Result:
+    """
+    Compute the answer to a single Job, or fetch it from the answer cache.
+
+    Only the solution is timed and profiled, not parsing the input, since the
+    parse may be shared with the other part.
+
+    If any profilers are selected, the answer is always computed, since there
+    is nothing to learn from profiling a cache lookup.
+    """
+    example = get_puzzle_inputs(job.day, job.part, job.test)[job.seq]
+    solution = get_puzzle_solution(job.day, job.part)
+    elapsed = 0
+
+    def compute() -> int:
+        nonlocal elapsed
+
+        parsed = parse_once(job.day, example.input)
+        start = time.perf_counter_ns()
+        answer = solution(parsed) or 0
+        elapsed = time.perf_counter_ns() - start
+
+        return answer
+
+    report = None
+    cached = False
+
+    if profile is not None and profile.enabled:
+        from aoc2023.profiling import profile_call
+
+        # Parsed first so that neither part's profile includes it
+        parse_once(job.day, example.input)
+
+        name = f"day{job.day:02d}_{job.part.lower()}_{'test' if job.test else 'puzzle'}"
+        answer, report = profile_call(
+            compute,
+            options=profile,
+            name=f"{name}_{job.seq + 1:02d}",
+        )
+
+    elif cache:
+        start = time.perf_counter_ns()
+        answer, cached = solve_cached(job, example.input, compute)
+        if cached:
+            elapsed = time.perf_counter_ns() - start
+
+    else:
+        answer = compute()
+
+    return Result(*job, answer, example.solution, elapsed, report, cached)
+
+
+@cache
+def get_answer_cache() -> Optional["AnswerCache"]:
+    """
+    Open the answer cache once per process, and keep it open.
+
+    Returns None, after a single warning, if the cache can't be opened.
+    """
+    import sqlite3
+
+    from aoc2023.cache import AnswerCache
+
+    logger = logging.getLogger(__name__)
+
+    try:
+        return AnswerCache().open()
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Answer cache unavailable: %s", e)
+        return None
+
+
+def solve_cached(
+    job: Job,
+    input_: str,
+    compute: Callable[[], int],
+) -> tuple[int, bool]:
+    """
+    Return the cached answer for an input, computing and saving it if needed.
+
+    Also returns whether the answer came from the cache.
+    """
+    import sqlite3
+
+    from aoc2023.cache import cache_key
+
+    logger = logging.getLogger(__name__)
+
+    answers = get_answer_cache()
+    if answers is None:
+        return compute(), False
+
+    try:
+        key = cache_key(job.day, job.part, input_)
+        answer = answers.get(key)
+        if answer is not None:
+            logger.debug("Using cached answer for %s", job)
+            return answer, True
+
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Answer cache unavailable: %s", e)
+        return compute(), False
+
+    answer = compute()
+
+    try:
+        answers.put(key, answer)
+    except sqlite3.Error as e:
+        logger.warning("Could not save answer to the cache: %s", e)
+
+    return answer, False
+
+
+def run_jobs(
+    jobs: Iterable[Job],
+    workers: int = 1,
+    cache: bool = False,
+    profile: Optional["ProfileOptions"] = None,
+) -> Iterator[Result]:
+    """
+    Compute each Job, yielding the Results in the same order as the Jobs.
+
+    Args:
+        jobs (Iterable[Job]): The Jobs to compute.
+        workers (int, optional): The number of processes to compute Jobs in.
+            1 computes them in this process; 0 uses one process per CPU.
+            Defaults to 1.
+        cache (bool, optional): Use and update the on-disk answer cache.
+            Defaults to False.
+        profile (ProfileOptions, optional): Profilers to wrap each solution
+            in. Defaults to None.
+    """
+    logger = logging.getLogger(__name__)
+    solver = partial(solve, cache=cache, profile=profile)
+
+    if workers == 1:
+        yield from map(solver, jobs)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    logger.debug("Computing jobs with %s workers", workers or "all")
+    with ProcessPoolExecutor(max_workers=workers or None) as pool:
+        yield from pool.map(solver, jobs)
@@ -0,0 +1,636 @@
+"""AOC 2023 package tests."""
+
+import gzip
+import json
+import lzma
+import mmap
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from aoc2023.bench import (
+    BenchOptions,
+    bench_job,
+    bench_scaling,
+    scale_sizes,
+    time_solution,
+)
+from aoc2023.cache import AnswerCache, CacheKey, cache_key
+from aoc2023.corpus import list_corpus, load_answers, run_corpus, summarize
+from aoc2023.data import (
+    PART_NAMES,
+    PUZZLE_INPUT_FILENAME,
+    Example,
+    discover_solutions,
+    get_puzzle_generator,
+    get_puzzle_input,
+    iter_lines,
+    iter_puzzle_input,
+    map_puzzle_input,
+)
+from aoc2023.fetch import FetchOptions, HttpFetcher, InputStore, fetch_days
+from aoc2023.manifest import SOLUTIONS
+from aoc2023.profiling import ProfileOptions, profile_call
+from aoc2023.runner import Job, list_jobs, parse_once, run_jobs, solve
+
+# Cumulative time to import the CLI, in microseconds, as reported by
+# `python -X importtime`
+CLI_IMPORT_BUDGET_US = 150_000
+
+# Modules that should only be imported once output or a feature needs them
+CLI_DEFERRED_IMPORTS = (
+    "rich",
+    "sqlite3",
+    "concurrent",
+    "aoc2023.bench",
+    "aoc2023.corpus",
+)
+
+
+def test_manifest_current() -> None:
+    """Test that the manifest lists every day and part with a solution."""
+    assert discover_solutions() == SOLUTIONS, "Run `manage.py manifest`"
+
+
+def cumulative_import_times(*args: str) -> dict[str, int]:
+    """Run Python with `-X importtime`, returning each module's cumulative time."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        _, total, module = line.split("|")
+        cumulative[module.strip()] = int(total)
+
+    return cumulative
+
+
+def test_cli_import_time() -> None:
+    """Test that importing the CLI is within budget and defers heavy imports."""
+    pytest.importorskip("click")
+
+    cumulative = cumulative_import_times("-c", "import aoc2023.__main__")
+
+    for module in cumulative:
+        assert not module.startswith(CLI_DEFERRED_IMPORTS), module
+
+    assert cumulative["aoc2023.__main__"] < CLI_IMPORT_BUDGET_US
+
+
+def test_cli_json_imports() -> None:
+    """Test that a machine-readable run never imports the deferred modules."""
+    pytest.importorskip("click")
+
+    cumulative = cumulative_import_times(
+        "-m",
+        "aoc2023",
+        "1",
+        "A",
+        "--test",
+        "--no-cache",
+        "--format",
+        "json",
+    )
+
+    assert "aoc2023.runner" in cumulative
+    for module in cumulative:
+        assert not module.startswith(CLI_DEFERRED_IMPORTS), module
+
+
+@pytest.mark.parametrize(
+    "given",
+    [
+        b"",
+        b"one",
+        b"one\ntwo\n",
+        b"one\r\ntwo\r\n\nfour",
+    ],
+)
+def test_iter_lines(tmp_path: Path, given: bytes) -> None:
+    """Test that lines of a memory-mapped file match splitting the bytes."""
+    assert [bytes(line) for line in iter_lines(given)] == given.splitlines()
+
+    if len(given) <= 0:
+        return
+
+    input_path = tmp_path / "input.data"
+    input_path.write_bytes(given)
+
+    with open(input_path, "rb") as input_fh, mmap.mmap(
+        input_fh.fileno(),
+        0,
+        access=mmap.ACCESS_READ,
+    ) as buffer:
+        lines = [bytes(line) for line in iter_lines(buffer)]
+
+    assert lines == given.splitlines()
+
+
+def test_map_puzzle_input_loop(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that lines can be used in a plain for loop, which keeps the last one."""
+    monkeypatch.setattr("importlib.resources.files", lambda _: tmp_path)
+    (tmp_path / PUZZLE_INPUT_FILENAME).write_bytes(b"1\n2\n3\n")
+
+    lines: list[bytes] = []
+    with map_puzzle_input(1) as buffer:
+        for line in iter_lines(buffer):
+            lines.append(bytes(line))
+
+    assert lines == [b"1", b"2", b"3"]
+    assert bytes(line) == b"3"
+
+    # Stopping early leaves the generator, and its view, alive too
+    with map_puzzle_input(1) as buffer:
+        first = next(iter_lines(buffer))
+
+    assert bytes(first) == b"1"
+
+
+@pytest.mark.parametrize(
+    ("max_size", "expected"),
+    [
+        (1, [1]),
+        (10, [10]),
+        (50, [10, 50]),
+        (1000, [10, 100, 1000]),
+    ],
+)
+def test_scale_sizes(max_size: int, expected: list[int]) -> None:
+    """Test that sizes grow geometrically and end at the maximum."""
+    assert scale_sizes(max_size) == expected
+
+
+@pytest.mark.parametrize("day", sorted(SOLUTIONS))
+def test_bench_scaling(day: int) -> None:
+    """Test that every solved day can be timed over generated inputs."""
+    assert get_puzzle_generator(day) is not None
+
+    options = BenchOptions(min_runs=1, min_time_ns=0)
+    stats = list(bench_scaling(day, "A", [5, 10], options=options))
+
+    assert [s.size for s in stats] == [5, 10]
+    assert all(s.runs >= 1 and s.peak_memory for s in stats)
+    assert stats[0].input_bytes < stats[1].input_bytes
+
+
+# Days the stand-in server fails once with a server error, or doesn't have
+FLAKY_DAY = 2
+MISSING_DAY = 3
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves `input N` for day N, failing on the flaky and missing days."""
+
+    requests: list[str]
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.requests.append(self.path)
+        day = int(self.path.split("/")[3])
+
+        if day == MISSING_DAY:
+            self.send_error(404)
+            return
+
+        if day == FLAKY_DAY and self.requests.count(self.path) == 1:
+            self.send_error(503)
+            return
+
+        body = f"input {day}\n".encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def stand_in_server() -> Iterator[tuple[str, list[str]]]:
+    """Run a local stand-in for the AoC website, returning its URL and requests."""
+    requests: list[str] = []
+    handler = type("Handler", (StandInHandler,), {"requests": requests})
+
+    with ThreadingHTTPServer(("127.0.0.1", 0), handler) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}", requests
+        server.shutdown()
+
+
+def test_fetch_days(stand_in_server: tuple[str, list[str]], tmp_path: Path) -> None:
+    """Test that inputs are fetched with retries, stored, and then skipped."""
+    base_url, requests = stand_in_server
+    store = InputStore(tmp_path)
+    fetcher = HttpFetcher(base_url=base_url)
+    options = FetchOptions(min_interval=0, backoff=0)
+
+    results = fetch_days(fetcher, 2023, [1, 2, 3], store, options)
+
+    assert [r.error is None for r in results] == [True, True, False]
+    assert store.get(2023, 1) == "input 1\n"
+    assert store.get(2023, 2) == "input 2\n"
+    assert store.get(2023, 3) is None
+    # Day 2 was retried after a server error; day 3 wasn't retried
+    assert len(requests) == 4  # noqa: PLR2004
+
+    results = fetch_days(fetcher, 2023, [1, 2], store, options)
+
+    assert all(r.skipped for r in results)
+    assert len(requests) == 4  # noqa: PLR2004
+
+
+def test_input_store_dedupes(tmp_path: Path) -> None:
+    """Test that identical inputs are only stored once."""
+    store = InputStore(tmp_path)
+
+    assert store.put(2023, 1, "same") == store.put(2023, 2, "same")
+    assert len(list((tmp_path / "objects").rglob("*"))) == 2  # noqa: PLR2004
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdCompressor().compress(data)  # type: ignore[no-any-return]
+
+
+@pytest.mark.parametrize(
+    ("suffix", "compress"),
+    [
+        pytest.param("", bytes, id="plain"),
+        pytest.param(".gz", gzip.compress, id="gz"),
+        pytest.param(".xz", lzma.compress, id="xz"),
+        pytest.param(".zst", _zstd_compress, id="zst"),
+    ],
+)
+def test_compressed_input(
+    suffix: str,
+    compress: Callable[[bytes], bytes],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that compressed inputs are found and read like plain ones."""
+    monkeypatch.setattr("importlib.resources.files", lambda _: tmp_path)
+    (tmp_path / f"{PUZZLE_INPUT_FILENAME}{suffix}").write_bytes(compress(b"1\n2\n3\n"))
+
+    assert get_puzzle_input(1) == "1\n2\n3"
+    assert list(iter_puzzle_input(1)) == ["1", "2", "3"]
+
+    with map_puzzle_input(1) as buffer:
+        assert [bytes(line) for line in iter_lines(buffer)] == [b"1", b"2", b"3"]
+
+
+def test_uncompressed_input_preferred(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that an uncompressed input is used over a compressed one."""
+    monkeypatch.setattr("importlib.resources.files", lambda _: tmp_path)
+    (tmp_path / f"{PUZZLE_INPUT_FILENAME}.gz").write_bytes(gzip.compress(b"old"))
+    (tmp_path / PUZZLE_INPUT_FILENAME).write_bytes(b"new")
+
+    assert get_puzzle_input(1) == "new"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_corpus(workers: int, tmp_path: Path) -> None:
+    """Test that every input in a corpus is solved and checked, in order."""
+    from aoc2023.day01.data import PART_A_EXAMPLES
+
+    example = PART_A_EXAMPLES[0]
+    (tmp_path / "a.txt").write_text(example.input)
+    (tmp_path / "b.txt.gz").write_bytes(gzip.compress(example.input.encode()))
+    (tmp_path / "c.txt").write_text("no digits")
+    (tmp_path / "d.txt.gz").write_bytes(b"not gzip")
+    answers_path = tmp_path / "answers.json"
+    answers_path.write_text(
+        f'{{"a.txt": {example.solution}, "b.txt.gz": {{"A": 0, "B": 1}}}}',
+    )
+
+    paths = list_corpus(tmp_path, exclude=[answers_path])
+    answers = load_answers(answers_path, "a")
+    results = list(run_corpus(1, "A", paths, answers, workers))
+
+    assert [r.name for r in results] == ["a.txt", "b.txt.gz", "c.txt", "d.txt.gz"]
+    assert [r.correct for r in results] == [True, False, None, None]
+    # Both a failed solution and an unreadable input are recorded, not raised
+    assert results[2].error is not None
+    assert results[3].error is not None
+    assert results[3].input_bytes == 0
+
+    summary = summarize(results, wall_ns=1, slowest=2)
+    assert (summary.correct, summary.wrong, summary.failed) == (1, 1, 2)
+    assert len(summary.slowest) == 2  # noqa: PLR2004
+
+
+def test_cli_corpus_answers(tmp_path: Path) -> None:
+    """Test that an answers file kept in the corpus isn't run as an input."""
+    from click.testing import CliRunner
+
+    from aoc2023.__main__ import cli
+    from aoc2023.day01.data import PART_A_EXAMPLES
+
+    example = PART_A_EXAMPLES[0]
+    (tmp_path / "a.txt").write_text(example.input)
+    answers_path = tmp_path / "answers.json"
+    answers_path.write_text(f'{{"a.txt": {example.solution}}}')
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "1",
+            "A",
+            "--corpus",
+            str(tmp_path),
+            "--answers",
+            str(answers_path),
+            "--format",
+            "json",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    records = json.loads(result.output)
+    assert [(r["name"], r["correct"]) for r in records] == [("a.txt", True)]
+
+
+def test_run_jobs_parallel() -> None:
+    """Test that a process pool gives the same results, in the same order."""
+    jobs = list_jobs(sorted(SOLUTIONS), PART_NAMES, test=True)
+
+    serial = list(run_jobs(jobs))
+    parallel = list(run_jobs(jobs, workers=2))
+
+    # Everything but the timings should match
+    assert [r[:6] for r in parallel] == [r[:6] for r in serial]
+    assert [r[:4] for r in parallel] == jobs
+    assert all(r.correct for r in parallel)
+
+
+@pytest.fixture()
+def counted_parser(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace every day's parse hook with one that records its inputs."""
+    calls: list[str] = []
+
+    def parse(input_: str) -> list[str]:
+        calls.append(input_)
+        return input_.splitlines()
+
+    monkeypatch.setattr("aoc2023.runner._parsed", {})
+    monkeypatch.setattr("aoc2023.runner.get_puzzle_parser", lambda _: parse)
+    return calls
+
+
+def test_parse_once(counted_parser: list[str]) -> None:
+    """Test that the same input is only parsed once, even as a new string."""
+    input_ = "one\ntwo"
+
+    parsed = parse_once(1, input_)
+    assert parsed == ["one", "two"]
+    assert parse_once(1, input_) is parsed
+    assert parse_once(1, "".join(["one\n", "two"])) is parsed
+    assert counted_parser == [input_]
+
+    # Only the last input of each day is kept
+    assert parse_once(2, input_) is not parsed
+    assert parse_once(1, "three") == ["three"]
+    assert parse_once(1, input_) is not parsed
+    assert len(counted_parser) == 4  # noqa: PLR2004
+
+
+def test_parse_once_without_hook(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that days without a parse hook get their input unchanged."""
+    monkeypatch.setattr("aoc2023.runner.get_puzzle_parser", lambda _: None)
+
+    assert parse_once(1, "input") == "input"
+
+
+def test_solve_excludes_parse(
+    counted_parser: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that both parts share one parse, and neither is timed with it."""
+    parse_ns = 50_000_000
+
+    def slow_parse(input_: str) -> list[str]:
+        time.sleep(parse_ns / 1e9)
+        counted_parser.append(input_)
+        return input_.splitlines()
+
+    monkeypatch.setattr("aoc2023.runner.get_puzzle_parser", lambda _: slow_parse)
+    monkeypatch.setattr("aoc2023.runner.get_puzzle_solution", lambda *_: len)
+    monkeypatch.setattr(
+        "aoc2023.runner.get_puzzle_inputs",
+        lambda *_: [Example("one\ntwo", 2)],
+    )
+
+    results = [solve(Job(1, part, test=True, seq=0)) for part in PART_NAMES]
+
+    assert len(counted_parser) == 1
+    assert all(r.correct for r in results)
+    assert all(r.elapsed_ns < parse_ns for r in results)
+
+
+@pytest.mark.parametrize(
+    ("options", "expected_runs"),
+    [
+        pytest.param(BenchOptions(warmup=2, min_runs=3, min_time_ns=0), 3, id="min"),
+        pytest.param(
+            BenchOptions(warmup=0, max_runs=4, min_time_ns=10**12),
+            4,
+            id="max",
+        ),
+    ],
+)
+def test_time_solution_runs(options: BenchOptions, expected_runs: int) -> None:
+    """Test that runs stop at the bounds, after the untimed warmup runs."""
+    calls: list[str] = []
+
+    samples = time_solution(calls.append, "input", options)
+
+    assert len(samples) == expected_runs
+    assert len(calls) == options.warmup + expected_runs
+    assert all(sample >= 0 for sample in samples)
+
+
+def test_bench_job() -> None:
+    """Test the statistics for a benchmarked example."""
+    job = Job(1, "A", test=True, seq=0)
+    stats = bench_job(job, BenchOptions(min_runs=20, max_runs=20, min_time_ns=0))
+
+    assert stats[:4] == job
+    assert stats.runs == 20  # noqa: PLR2004
+    assert stats.min_ns <= stats.median_ns <= stats.p95_ns
+    assert stats.input_bytes > 0
+    assert stats.throughput > 0
+
+
+def test_cli_bench_json(tmp_path: Path) -> None:
+    """Test that --bench-json saves one record per job."""
+    from click.testing import CliRunner
+
+    from aoc2023.__main__ import cli
+
+    out_path = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli,
+        ["1", "ALL", "--test", "--bench-json", str(out_path)],
+    )
+
+    assert result.exit_code == 0, result.output
+
+    records = json.loads(out_path.read_text())
+    assert [(r["day"], r["part"]) for r in records] == [(1, "A"), (1, "B")]
+    assert all(r["min_ns"] <= r["median_ns"] <= r["p95_ns"] for r in records)
+    assert all(r["throughput"] > 0 for r in records)
+
+
+def test_profile_call(tmp_path: Path) -> None:
+    """Test that profiling returns the answer along with every report."""
+
+    def allocate() -> int:
+        return len([0] * 100_000)
+
+    options = ProfileOptions(cpu=True, memory=True, dump_dir=tmp_path / "prof")
+    answer, report = profile_call(allocate, options=options, name="allocate")
+
+    assert answer == 100_000  # noqa: PLR2004
+    assert report.hot_functions is not None
+    assert "allocate" in report.hot_functions
+    assert report.peak_memory is not None
+    assert report.peak_memory >= 100_000 * 8
+    assert report.dump_path == str(tmp_path / "prof" / "allocate.prof")
+    assert Path(report.dump_path).is_file()
+
+
+def test_profile_call_disabled() -> None:
+    """Test that nothing is reported for profilers that weren't selected."""
+    answer, report = profile_call(lambda: 42, options=ProfileOptions())
+
+    assert answer == 42  # noqa: PLR2004
+    assert report == (None, None, None)
+
+
+def test_answer_cache(tmp_path: Path) -> None:
+    """Test that answers are saved and found again by key."""
+    key = CacheKey(1, "A", "input", "solution")
+
+    with AnswerCache(tmp_path / "answers.sqlite3") as answers:
+        assert answers.get(key) is None
+        answers.put(key, 142)
+        assert answers.get(key) == 142  # noqa: PLR2004
+
+    with AnswerCache(tmp_path / "answers.sqlite3") as answers:
+        assert answers.get(key) == 142  # noqa: PLR2004
+
+
+def test_answer_cache_evicts_lru(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the least recently used answer is evicted when full."""
+    clock = iter(range(1000))
+    monkeypatch.setattr("aoc2023.cache.time.time", lambda: next(clock))
+    keys = [CacheKey(1, "A", f"input{n}", "solution") for n in range(3)]
+
+    with AnswerCache(tmp_path / "answers.sqlite3", max_entries=2) as answers:
+        answers.put(keys[0], 0)
+        answers.put(keys[1], 1)
+        # Using the first answer makes the second the least recently used
+        assert answers.get(keys[0]) == 0
+        answers.put(keys[2], 2)
+
+        assert answers.get(keys[0]) == 0
+        assert answers.get(keys[1]) is None
+        assert answers.get(keys[2]) == 2  # noqa: PLR2004
+
+
+def test_cache_key_invalidation(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that changing the input or the solution source changes the key."""
+    source_path = tmp_path / "solution.py"
+    source_path.write_text("ANSWER = 1\n")
+    monkeypatch.setattr("aoc2023.cache._solution_path", lambda _: source_path)
+
+    key = cache_key(1, "A", "input")
+
+    assert cache_key(1, "a", "input") == key
+    assert cache_key(1, "A", "other input") != key
+
+    source_path.write_text("ANSWER = 12\n")
+    changed_key = cache_key(1, "A", "input")
+    assert changed_key != key
+
+    with AnswerCache(tmp_path / "answers.sqlite3") as answers:
+        answers.put(key, 1)
+        assert answers.get(changed_key) is None
+
+
+def test_run_jobs_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that answers from the cache are flagged as cached."""
+    from aoc2023.runner import get_answer_cache
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    get_answer_cache.cache_clear()
+    jobs = list_jobs([1], PART_NAMES, test=True)
+
+    try:
+        computed = list(run_jobs(jobs, cache=True))
+        cached = list(run_jobs(jobs, cache=True))
+    finally:
+        answers = get_answer_cache()
+        if answers is not None:
+            answers.close()
+        get_answer_cache.cache_clear()
+
+    assert not any(r.cached for r in computed)
+    assert all(r.cached for r in cached)
+    assert [r.answer for r in cached] == [r.answer for r in computed]
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson", "csv"])
+def test_write_records(
+    output_format: str,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that every output format reads back as the same records."""
+    import csv
+
+    from aoc2023.__main__ import write_records
+
+    results = list(run_jobs(list_jobs([1], PART_NAMES, test=True)))
+    write_records(results, output_format)
+    output = capsys.readouterr().out
+
+    if output_format == "json":
+        records = json.loads(output)
+    elif output_format == "ndjson":
+        records = [json.loads(line) for line in output.splitlines()]
+    else:
+        records = list(csv.DictReader(output.splitlines()))
+
+    assert len(records) == len(results)
+    for record, result in zip(records, results, strict=True):
+        expected = result.as_dict()
+        assert list(record) == list(expected)
+        # CSV holds every value as a string
+        if output_format == "csv":
+            expected = {k: "" if v is None else str(v) for k, v in expected.items()}
+        assert record == expected
@@ -2,11 +2,12 @@
 
 """Management script for aoc2023."""
 
+import importlib
 import logging
 import os
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import aocd  # type: ignore[import-untyped]
 import click
@@ -16,15 +17,32 @@ from rich.logging import RichHandler
 
 import aoc2023
 from aoc2023.data import (
+    COMPRESSION_SUFFIXES,
     DAY_COUNT_MAX,
     DAY_COUNT_MIN,
     DAY_SUBMODULE_FMT,
     PUZZLE_INPUT_FILENAME,
     YEAR,
+    discover_solutions,
+)
+from aoc2023.fetch import (
+    FETCH_MIN_INTERVAL,
+    FETCH_RETRIES,
+    FETCH_WORKERS,
+    Fetcher,
+    FetchError,
+    FetchOptions,
+    HttpFetcher,
+    InputStore,
+    fetch_days,
 )
 
 CLICK_CONTEXT = {"help_option_names": ["-h", "--help"]}
 DAY_TEMPLATE_PATH = Path(__file__).absolute().parent / "templates" / "day"
+MANIFEST_TEMPLATE_PATH = Path(__file__).absolute().parent / "templates"
+MANIFEST_FILENAME = "manifest.py"
+
+COMPRESSION_CHOICES = ("none", *(suffix.lstrip(".") for suffix in COMPRESSION_SUFFIXES))
 
 
 def setup_logging(verbosity: int = 0) -> None:
@@ -58,30 +76,135 @@ def get_day_path(day: int) -> Path:
     ).absolute().parent / DAY_SUBMODULE_FMT.format(day)
 
 
-def get_puzzle_input_path(day: int) -> Path:
-    """Return the path to the particular day's input."""
-    return get_day_path(day) / PUZZLE_INPUT_FILENAME
+def get_puzzle_input_path(day: int, compress: str = "none") -> Path:
+    """Return the path to the particular day's input, compressed or not."""
+    suffix = "" if compress == "none" else f".{compress}"
+    return get_day_path(day) / f"{PUZZLE_INPUT_FILENAME}{suffix}"
 
 
-def _get_puzzle_input(year: int, day: int) -> str:
-    """Extract the personalized puzzle input from the AoC website."""
+def write_puzzle_input(day: int, puzzle_input: str, compress: str = "none") -> Path:
+    """
+    Save a day's input, compressed or not, replacing any other copy of it.
+
+    Empty inputs are never compressed, so they are easy to spot and fill in.
+    """
+    if not puzzle_input:
+        compress = "none"
+
+    data = puzzle_input.encode("utf-8")
+
+    if compress == "gz":
+        import gzip
+
+        data = gzip.compress(data)
+
+    elif compress == "xz":
+        import lzma
+
+        data = lzma.compress(data)
+
+    elif compress == "zst":
+        try:
+            import zstandard  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise click.ClickException("zst compression needs zstandard") from e
+
+        data = zstandard.ZstdCompressor(level=19).compress(data)
+
+    path = get_puzzle_input_path(day, compress)
+    path.write_bytes(data)
+
+    # Compressed inputs are only found if there is no uncompressed one
+    for other in COMPRESSION_CHOICES:
+        other_path = get_puzzle_input_path(day, other)
+        if other_path != path:
+            other_path.unlink(missing_ok=True)
+
+    return path
+
+
+def write_manifest() -> None:
+    """Regenerate the manifest of days and parts with solutions."""
+    logger = logging.getLogger(__name__)
+
+    importlib.invalidate_caches()
+    solutions = discover_solutions()
+
+    manifest_path = Path(aoc2023.__file__).absolute().parent / MANIFEST_FILENAME
+    logger.info("Writing solution manifest to %s", manifest_path)
+
+    jinja_env = Environment(
+        loader=FileSystemLoader(MANIFEST_TEMPLATE_PATH, encoding="utf-8"),
+        keep_trailing_newline=True,
+    )
+    template = jinja_env.get_template(f"{MANIFEST_FILENAME}.j2")
+
+    with open(manifest_path, "w", encoding="utf-8") as out_fh:
+        out_fh.write(template.render(solutions=solutions))
+
+
+class AocdFetcher:
+    """Fetch inputs through advent-of-code-data."""
+
+    def __init__(self, token: str) -> None:
+        self.user = aocd.models.User(token=token)
+
+    def fetch(self, year: int, day: int) -> str:
+        try:
+            return aocd.models.Puzzle(year=year, day=day, user=self.user).input_data
+
+        except aocd.exceptions.AocdError as e:
+            raise FetchError(str(e)) from e
+
+        except Exception as e:  # Network errors surface as many types
+            raise FetchError(str(e), retryable=True) from e
+
+
+def get_fetcher(base_url: Optional[str] = None) -> Optional[Fetcher]:
+    """
+    Return a fetcher for puzzle inputs, or None if there is no AoC token.
+
+    With a base URL, inputs are fetched over plain HTTP from there instead,
+    and the token is optional.
+    """
     logger = logging.getLogger(__name__)
 
     load_dotenv()
     aoc_token = os.getenv("AOC_SESSION", None)
+
+    if base_url is not None:
+        return HttpFetcher(aoc_token, base_url)
+
     if aoc_token is None:
         logger.warning("No AoC token found")
-        return ""
+        return None
+
+    return AocdFetcher(aoc_token)
+
+
+def _get_puzzle_input(year: int, day: int) -> str:
+    """Return the personalized puzzle input, from the input store if possible."""
+    logger = logging.getLogger(__name__)
+
+    store = InputStore()
+    fetcher = get_fetcher()
+
+    if fetcher is None:
+        return store.get(year, day) or ""
 
     try:
-        u = aocd.models.User(token=aoc_token)
-        p = aocd.models.Puzzle(year=year, day=day, user=u)
-        return p.input_data
+        result = fetch_days(fetcher, year, [day], store)[0]
 
     except Exception:  # If anything fails, we still want to write the file
-        logger.warning("advent-of-code-data could not load the puzzle input")
+        logger.warning("The puzzle input could not be loaded")
+        return ""
+
+    if result.error is not None:
+        logger.warning("The puzzle input could not be loaded: %s", result.error)
         return ""
 
+    return store.get(year, day) or ""
+
 
 @click.group(context_settings=CLICK_CONTEXT)
 @click.option("-v", "--verbose", count=True)
@@ -100,7 +223,14 @@ def manage(verbose: int = 0) -> int:
 
 @click.command()
 @click.argument("number", type=int)
-def create_new_day(number: int) -> None:
+@click.option(
+    "--compress",
+    type=click.Choice(COMPRESSION_CHOICES),
+    default="none",
+    show_default=True,
+    help="Compress the puzzle input",
+)
+def create_new_day(number: int, compress: str = "none") -> None:
     """
     Create a new submodule for a day's solutions.
 
@@ -127,8 +257,8 @@ def create_new_day(number: int) -> None:
         logger.debug("Creating submodule directory")
         day_path.mkdir(exist_ok=True)
 
-    puzzle_input_path = get_puzzle_input_path(day=number)
     puzzle_input = _get_puzzle_input(YEAR, number)
+    puzzle_input_path = write_puzzle_input(number, puzzle_input, compress)
 
     if not puzzle_input:
         logger.warning(
@@ -137,9 +267,7 @@ def create_new_day(number: int) -> None:
             puzzle_input_path,
         )
     else:
-        logger.info("Saving Puzzle input to %s", puzzle_input_path)
-
-    puzzle_input_path.write_text(puzzle_input)
+        logger.info("Saved Puzzle input to %s", puzzle_input_path)
 
     # Part B solutions aren't available publicly, or privately until Part A
     # has been solved, so we will leave extraction up to the user.
@@ -168,8 +296,145 @@ def create_new_day(number: int) -> None:
             with open(day_path / output_filename, "w", encoding="utf-8") as out_fh:
                 out_fh.write(template.render(**template_context))
 
+    write_manifest()
+
+
+@click.command()
+def update_manifest() -> None:
+    """
+    Regenerate the manifest of days and parts with solutions.
+
+    Run this after adding examples to a day, which marks a part as solved.
+    """
+    write_manifest()
+
+
+@click.command()
+@click.argument(
+    "days",
+    nargs=-1,
+    type=click.IntRange(DAY_COUNT_MIN, DAY_COUNT_MAX),
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=FETCH_WORKERS,
+    show_default=True,
+    help="The most inputs to fetch at once",
+)
+@click.option(
+    "--retries",
+    type=click.IntRange(min=0),
+    default=FETCH_RETRIES,
+    show_default=True,
+    help="Times to retry a failed fetch",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0),
+    default=FETCH_MIN_INTERVAL,
+    show_default=True,
+    help="Seconds between the start of any two requests",
+)
+@click.option(
+    "--base-url",
+    default=None,
+    help="Fetch over HTTP from this URL instead of through advent-of-code-data",
+)
+@click.option(
+    "--store",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Directory of the input store; defaults to the user cache",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Fetch inputs even if they are already on disk",
+)
+@click.option(
+    "--compress",
+    type=click.Choice(COMPRESSION_CHOICES),
+    default="none",
+    show_default=True,
+    help="Compress the inputs saved to day submodules",
+)
+def fetch_inputs(  # noqa: PLR0913
+    days: tuple[int, ...],
+    jobs: int = FETCH_WORKERS,
+    retries: int = FETCH_RETRIES,
+    interval: float = FETCH_MIN_INTERVAL,
+    base_url: Optional[str] = None,
+    store: Optional[Path] = None,
+    force: bool = False,
+    compress: str = "none",
+) -> None:
+    """
+    Fetch puzzle inputs into the local input store.
+
+    DAYS are the days to fetch; all days if omitted. Days whose input is
+    already on disk are skipped. Inputs are also saved to any day submodule
+    that doesn't have one yet.
+    """
+    logger = logging.getLogger(__name__)
+
+    fetcher = get_fetcher(base_url)
+    if fetcher is None:
+        raise click.ClickException("Set AOC_SESSION to fetch puzzle inputs")
+
+    selected = days or tuple(range(DAY_COUNT_MIN, DAY_COUNT_MAX + 1))
+    if not force:
+        selected = tuple(d for d in selected if not _has_puzzle_input(d))
+
+    input_store = InputStore(store)
+    results = fetch_days(
+        fetcher,
+        YEAR,
+        selected,
+        input_store,
+        FetchOptions(
+            workers=jobs,
+            force=force,
+            retries=retries,
+            min_interval=interval,
+        ),
+    )
+
+    for result in results:
+        if result.error is not None:
+            click.echo(f"Day {result.day:2d}: failed, {result.error}")
+            continue
+
+        click.echo(
+            f"Day {result.day:2d}: {'stored' if result.skipped else 'fetched'} "
+            f"{result.digest}",
+        )
+
+        day_path = get_day_path(result.day)
+        if day_path.is_dir() and (force or not _has_puzzle_input(result.day)):
+            saved_path = write_puzzle_input(
+                result.day,
+                input_store.get(YEAR, result.day) or "",
+                compress,
+            )
+            logger.info("Saved Puzzle input to %s", saved_path)
+
+    if any(r.error is not None for r in results):
+        raise click.ClickException("Some puzzle inputs could not be fetched")
+
+
+def _has_puzzle_input(day: int) -> bool:
+    return any(
+        path.is_file() and path.stat().st_size > 0
+        for path in (get_puzzle_input_path(day, c) for c in COMPRESSION_CHOICES)
+    )
+
 
 manage.add_command(create_new_day, name="create")
+manage.add_command(fetch_inputs, name="fetch")
+manage.add_command(update_manifest, name="manifest")
 
 
 if __name__ == "__main__":